@@ -40,28 +40,167 @@ Execute in a live Houdini session via Synapse or Python Shell.
 
 from __future__ import annotations
 
+import functools
+import glob
 import os
 
 
-def build_focus_pull_example(
-    save_path: str = None,
-) -> str:
-    """
-    Build the focus pull demo .hip file.
+# ════════════════════════════════════════════════════════════
+# SCENE GEOMETRY
+# ════════════════════════════════════════════════════════════
+#
+# One entry per /obj geo container:
+#   prim  = (node type, node name, {parm: value})
+#   color = (color node name, (r, g, b))
+#   xform = {object-level parm tuple: (x, y, z)}
+
+_SCENE_GEOS = (
+    # Ground plane -- large checker-pattern ground for spatial
+    # reference and to show anamorphic distortion on straight lines
+    dict(
+        name="ground_plane",
+        prim=("grid", "ground",
+              {"sizex": 30, "sizey": 40, "rows": 60, "cols": 60}),
+        color=("checker_color", (0.18, 0.18, 0.18)),
+        xform={"t": (0.0, -1.2, 0.0)},
+    ),
+    # Foreground subject (z = -1.5) -- the focus pull DESTINATION
+    dict(
+        name="foreground_sphere",
+        prim=("sphere", "sphere",
+              {"radx": 0.4, "rady": 0.4, "radz": 0.4, "freq": 5}),
+        color=("warm_color", (0.8, 0.25, 0.12)),
+        xform={"t": (0.3, -0.4, -1.5)},
+    ),
+) + tuple(
+    # Mid-ground pillars (z = -5) -- two vertical tubes framing the
+    # composition; depth layering shows bokeh at different distances
+    dict(
+        name="pillar_" + side,
+        prim=("tube", "tube",
+              {"radscale": 0.25, "rad1": 0.25, "rad2": 0.25,
+               "height": 3.0, "rows": 2, "cols": 16, "cap": True}),
+        color=("pillar_color", (0.35, 0.35, 0.4)),
+        xform={"t": (tx_val, 0.3, -5.0)},
+    )
+    for side, tx_val in (("left", -1.8), ("right", 1.8))
+) + (
+    # Hero object -- background torus (z = -8). The initial focus
+    # target; shows anamorphic oval bokeh when out of focus
+    dict(
+        name="hero_torus",
+        prim=("torus", "torus",
+              {"radx": 1.2, "rady": 0.35, "rows": 30, "cols": 30}),
+        color=("hero_color", (0.15, 0.5, 0.7)),
+        xform={"t": (0.0, 0.3, -8.0), "r": (0.0, 25.0, 0.0)},
+    ),
+) + tuple(
+    # Flare sources (z = -14) -- bright emissive spheres behind the
+    # hero torus that trigger the anamorphic flare streak
+    dict(
+        name="flare_source_" + side,
+        prim=("sphere", "emissive",
+              {"radx": 0.15, "rady": 0.15, "radz": 0.15, "freq": 3}),
+        color=("bright", (1.0, 0.95, 0.85)),
+        xform={"t": (tx_val, 0.8 if side == "left" else 0.4, -14.0)},
+    )
+    for side, tx_val in (("left", -2.0), ("right", 1.5))
+)
 
-    Returns: Absolute path to saved .hip file.
-    """
+
+# ════════════════════════════════════════════════════════════
+# STICKY NOTE TEXT
+# ════════════════════════════════════════════════════════════
+
+_NOTE_OVERVIEW = """\
+CINEMA CAMERA RIG v4.0 -- Anamorphic Demo
+==========================================
+
+Cooke Anamorphic /i S35 50mm on ALEXA 35
+120 frames at 24fps (5 seconds)
+
+WHAT TO WATCH FOR:
+
+1. SQUEEZE BREATHING (frames 41-80)
+   Watch 'Effective Squeeze' parm during the focus rack.
+   Close focus = reduced squeeze = visible horizontal
+   breathing on straight lines (mumps effect).
+
+2. BIOMECHANICS
+   The camera dollies forward and pans right.
+   Spring/lag solver adds weight and subtle overshoot.
+   Compare: disable 'Enable Biomechanics' to see the
+   difference between raw keyframes and filtered motion.
+
+3. HANDHELD SHAKE
+   Subtle 0.15-degree tremor at 5.5 Hz.
+   Toggle 'Enable Handheld Shake' to compare.
+
+4. ANAMORPHIC FLARE
+   Bright spheres at z=-14 trigger horizontal streaks.
+   Visible in rendered output (COP post-processing).
+
+5. ENTRANCE PUPIL
+   Yellow-orange circle guide visible on the null
+   inside the HDA. Shows the nodal point for
+   parallax-correct panning."""
+
+_NOTE_SCENE = """\
+SCENE LAYOUT
+============
+
+Foreground sphere  z = -1.5  (focus destination)
+Mid-ground pillars z = -5.0  (depth framing)
+Hero torus         z = -8.0  (focus origin)
+Flare sources      z = -14.0 (bright highlights)
+
+Camera dollies z=4 -> z=2 with ry=0 -> ry=4 pan.
+Focus racks from 12m (hero) to 1.5m (foreground)
+between frames 41-80."""
+
+_NOTE_RENDER = """\
+RENDERING
+=========
+
+Karma XPU at /out/karma_xpu
+1920x1080, frames 1-120
+
+Camera points to internal cinema_camera node.
+Cooke /i metadata written to EXR automatically.
+
+For a quick preview: render frame 60
+(mid-rack, both planes partially in focus)."""
+
+
+# Sticky note layout: (name, text, position, size, color)
+_NOTES = (
+    ("note_overview", _NOTE_OVERVIEW, (-8, 4), (6, 7), (0.95, 0.9, 0.7)),
+    ("note_scene", _NOTE_SCENE, (-8, -4), (6, 3.5), (0.8, 0.9, 0.95)),
+    ("note_render", _NOTE_RENDER, (-8, -8), (6, 2.8), (0.85, 0.95, 0.85)),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _vec2(x: float, y: float):
+    """Shared hou.Vector2 for a constant (x, y); callers must not mutate."""
     import hou
+    return hou.Vector2(x, y)
 
-    if save_path is None:
-        save_path = os.path.join(
-            os.environ.get("CINEMA_CAMERA_PATH", ""),
-            "examples",
-            "cinema_rig_focus_pull_example.hip",
-        )
 
-    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+@functools.lru_cache(maxsize=None)
+def _color(r: float, g: float, b: float):
+    """Shared hou.Color for a constant (r, g, b); callers must not mutate."""
+    import hou
+    return hou.Color(r, g, b)
+
+
+def _norm_path(path: str) -> str:
+    """Comparable form of a file path (Houdini reports '/' separators)."""
+    return os.path.normcase(os.path.abspath(path))
+
 
+def _build_scene(hou, env_path: str) -> None:
+    """Populate /obj and /out with the demo scene (no save)."""
     # ── 1. Scene setup ────────────────────────────────────
     hou.hipFile.clear(suppress_save_prompt=True)
     hou.setFps(24)
@@ -69,175 +208,113 @@ def build_focus_pull_example(
     hou.playbar.setPlaybackRange(1, 120)
 
     # Load all cinema HDAs
-    hda_base = os.environ.get("CINEMA_CAMERA_PATH", "")
-    if hda_base:
-        hda_dir = os.path.join(hda_base, "hda")
-        for sub in ["", "chops", "post"]:
+    if env_path:
+        hda_dir = os.path.join(env_path, "hda")
+        # Files already loaded this session (e.g. a previous build) are
+        # skipped -- installFile() would re-parse the whole library.
+        installed = {_norm_path(f) for f in hou.hda.loadedFiles()}
+        for sub in ("", "chops", "post"):
             d = os.path.join(hda_dir, sub) if sub else hda_dir
-            if os.path.isdir(d):
-                for f in os.listdir(d):
-                    if f.endswith(".hda"):
-                        try:
-                            hou.hda.installFile(os.path.join(d, f))
-                        except Exception:
-                            pass
+            # Missing or non-directory paths simply yield nothing
+            for path in glob.iglob(os.path.join(glob.escape(d), "*.hda")):
+                key = _norm_path(path)
+                if key in installed:
+                    continue
+                try:
+                    hou.hda.installFile(path)
+                except Exception:
+                    pass
+                else:
+                    installed.add(key)
 
     obj = hou.node("/obj")
-
-    # ── Helper: keyframe a parm ───────────────────────────
-    def set_key(parm, frame, value):
-        k = hou.Keyframe()
+    out = hou.node("/out")
+
+    # ── Helper: set a parm only if the node exposes it ──
+    def setp(node, name, val):
+        p = node.parm(name)
+        if p:
+            p.set(val)
+        return p
+
+    # ── Helper: set a parm tuple only if the node exposes it ──
+    def setpt(node, name, vals):
+        pt = node.parmTuple(name)
+        if pt:
+            pt.set(vals)
+        return pt
+
+    # ── Helper: setter bound to a node's parm-name set ──
+    # One parms() walk up front; absent parms are then skipped by a
+    # set lookup instead of a parm() dispatch per probe.
+    def parm_setter(node):
+        names = {p.name() for p in node.parms()}
+
+        def maybe_set(name, val):
+            if name in names:
+                node.parm(name).set(val)
+                return True
+            return False
+        return maybe_set
+
+    # ── Helper: collect keyframes for a single setKeyframes() ──
+    # Auto-slope is the same for every key, so configure it once on a
+    # template and copy-construct from it.
+    key_tpl = hou.Keyframe()
+    key_tpl.setSlopeAuto(True)
+
+    def add_key(buf, frame, value):
+        k = hou.Keyframe(key_tpl)
         k.setFrame(frame)
         k.setValue(value)
-        k.setSlopeAuto(True)
-        parm.setKeyframe(k)
-
-    # ── 2. Ground plane ───────────────────────────────────
-    # Large checker-pattern ground for spatial reference and
-    # to show anamorphic distortion on straight lines
-    geo_ground = obj.createNode("geo", "ground_plane")
-    grid = geo_ground.createNode("grid", "ground")
-    grid.parm("sizex").set(30)
-    grid.parm("sizey").set(40)
-    grid.parm("rows").set(60)
-    grid.parm("cols").set(60)
-    # Add color for checker pattern
-    color_node = geo_ground.createNode("color", "checker_color")
-    color_node.setInput(0, grid)
-    color_node.parm("colorr").set(0.18)
-    color_node.parm("colorg").set(0.18)
-    color_node.parm("colorb").set(0.18)
-    color_node.setDisplayFlag(True)
-    color_node.setRenderFlag(True)
-    geo_ground.parm("ty").set(-1.2)
-    geo_ground.layoutChildren()
-
-    # ── 3. Foreground subject (z = -1.5) ──────────────────
-    # Close to camera -- the focus pull DESTINATION
-    geo_fg = obj.createNode("geo", "foreground_sphere")
-    fg_sphere = geo_fg.createNode("sphere", "sphere")
-    fg_sphere.parm("radx").set(0.4)
-    fg_sphere.parm("rady").set(0.4)
-    fg_sphere.parm("radz").set(0.4)
-    fg_sphere.parm("freq").set(5)
-    fg_color = geo_fg.createNode("color", "warm_color")
-    fg_color.setInput(0, fg_sphere)
-    fg_color.parm("colorr").set(0.8)
-    fg_color.parm("colorg").set(0.25)
-    fg_color.parm("colorb").set(0.12)
-    fg_color.setDisplayFlag(True)
-    fg_color.setRenderFlag(True)
-    geo_fg.parm("tz").set(-1.5)
-    geo_fg.parm("tx").set(0.3)
-    geo_fg.parm("ty").set(-0.4)
-    geo_fg.layoutChildren()
-
-    # ── 4. Mid-ground pillars (z = -5) ────────────────────
-    # Two vertical tubes framing the composition -- creates
-    # depth layering and shows bokeh at different distances
-    for side, tx_val in [("left", -1.8), ("right", 1.8)]:
-        geo_pillar = obj.createNode("geo", "pillar_" + side)
-        tube = geo_pillar.createNode("tube", "tube")
-        tube.parm("radscale").set(0.25)
-        tube.parm("rad1").set(0.25)
-        tube.parm("rad2").set(0.25)
-        tube.parm("height").set(3.0)
-        tube.parm("rows").set(2)
-        tube.parm("cols").set(16)
-        tube.parm("cap").set(True)
-        pil_color = geo_pillar.createNode("color", "pillar_color")
-        pil_color.setInput(0, tube)
-        pil_color.parm("colorr").set(0.35)
-        pil_color.parm("colorg").set(0.35)
-        pil_color.parm("colorb").set(0.4)
-        pil_color.setDisplayFlag(True)
-        pil_color.setRenderFlag(True)
-        geo_pillar.parm("tz").set(-5)
-        geo_pillar.parm("tx").set(tx_val)
-        geo_pillar.parm("ty").set(0.3)
-        geo_pillar.layoutChildren()
-
-    # ── 5. Hero object -- background torus (z = -8) ───────
-    # The initial focus target. Torus shows anamorphic oval
-    # bokeh beautifully when out of focus
-    geo_hero = obj.createNode("geo", "hero_torus")
-    torus = geo_hero.createNode("torus", "torus")
-    torus.parm("radx").set(1.2)
-    torus.parm("rady").set(0.35)
-    torus.parm("rows").set(30)
-    torus.parm("cols").set(30)
-    hero_color = geo_hero.createNode("color", "hero_color")
-    hero_color.setInput(0, torus)
-    hero_color.parm("colorr").set(0.15)
-    hero_color.parm("colorg").set(0.5)
-    hero_color.parm("colorb").set(0.7)
-    hero_color.setDisplayFlag(True)
-    hero_color.setRenderFlag(True)
-    geo_hero.parm("tz").set(-8)
-    geo_hero.parm("ty").set(0.3)
-    geo_hero.parm("ry").set(25)
-    geo_hero.layoutChildren()
-
-    # ── 6. Flare sources (z = -14) ────────────────────────
-    # Bright emissive spheres that trigger the anamorphic
-    # flare streak. Placed behind the hero torus so flare
-    # streaks across the composition
-    for side, tx_val in [("left", -2.0), ("right", 1.5)]:
-        geo_light = obj.createNode("geo", "flare_source_" + side)
-        light_sphere = geo_light.createNode("sphere", "emissive")
-        light_sphere.parm("radx").set(0.15)
-        light_sphere.parm("rady").set(0.15)
-        light_sphere.parm("radz").set(0.15)
-        light_sphere.parm("freq").set(3)
-        # Bright emission color (will be > 1.0 in linear, triggering flare)
-        light_color = geo_light.createNode("color", "bright")
-        light_color.setInput(0, light_sphere)
-        light_color.parm("colorr").set(1.0)
-        light_color.parm("colorg").set(0.95)
-        light_color.parm("colorb").set(0.85)
-        light_color.setDisplayFlag(True)
-        light_color.setRenderFlag(True)
-        geo_light.parm("tz").set(-14)
-        geo_light.parm("tx").set(tx_val)
-        geo_light.parm("ty").set(0.8 if side == "left" else 0.4)
-        geo_light.layoutChildren()
+        buf.append(k)
+
+    # ── Helper: geo container + primitive + color ──────────
+    def make_geo(spec):
+        geo = obj.createNode("geo", spec["name"])
+        prim_type, prim_name, prim_parms = spec["prim"]
+        prim = geo.createNode(prim_type, prim_name)
+        for name, val in prim_parms.items():
+            prim.parm(name).set(val)
+        color_name, rgb = spec["color"]
+        color = geo.createNode("color", color_name)
+        color.setInput(0, prim)
+        color.parmTuple("color").set(rgb)
+        for name, vals in spec["xform"].items():
+            geo.parmTuple(name).set(vals)
+        # Flags last, once the chain is fully wired and configured
+        color.setDisplayFlag(True)
+        color.setRenderFlag(True)
+        # Two-node chain: stack color under the primitive directly
+        # rather than running a layout pass per container.
+        color.setPosition(prim.position() + _vec2(0, -1))
+        return geo
+
+    # ── 2-6. Scene geometry ───────────────────────────────
+    for spec in _SCENE_GEOS:
+        make_geo(spec)
 
     # ── 7. Scene light ────────────────────────────────────
     # Key light -- warm, slightly above and to the right
     try:
         key_light = obj.createNode("hlight", "key_light")
-        key_light.parm("tx").set(5)
-        key_light.parm("ty").set(6)
-        key_light.parm("tz").set(2)
+        key_light.parmTuple("t").set((5.0, 6.0, 2.0))
         # Point at scene center
-        if key_light.parm("lookatpath"):
-            key_light.parm("lookatpath").set("")
-        key_light.parm("rx").set(-35)
-        key_light.parm("ry").set(25)
+        setp(key_light, "lookatpath", "")
+        key_light.parmTuple("r").set((-35.0, 25.0, 0.0))
         # Warm color
-        if key_light.parm("light_colorr"):
-            key_light.parm("light_colorr").set(1.0)
-            key_light.parm("light_colorg").set(0.92)
-            key_light.parm("light_colorb").set(0.82)
-        if key_light.parm("light_intensity"):
-            key_light.parm("light_intensity").set(1.0)
+        setpt(key_light, "light_color", (1.0, 0.92, 0.82))
+        setp(key_light, "light_intensity", 1.0)
     except hou.OperationFailed:
         pass
 
     # Fill light -- cooler, from the left
     try:
         fill_light = obj.createNode("hlight", "fill_light")
-        fill_light.parm("tx").set(-4)
-        fill_light.parm("ty").set(3)
-        fill_light.parm("tz").set(-3)
-        fill_light.parm("rx").set(-15)
-        fill_light.parm("ry").set(-30)
-        if fill_light.parm("light_colorr"):
-            fill_light.parm("light_colorr").set(0.7)
-            fill_light.parm("light_colorg").set(0.8)
-            fill_light.parm("light_colorb").set(1.0)
-        if fill_light.parm("light_intensity"):
-            fill_light.parm("light_intensity").set(0.4)
+        fill_light.parmTuple("t").set((-4.0, 3.0, -3.0))
+        fill_light.parmTuple("r").set((-15.0, -30.0, 0.0))
+        setpt(fill_light, "light_color", (0.7, 0.8, 1.0))
+        setp(fill_light, "light_intensity", 0.4)
     except hou.OperationFailed:
         pass
 
@@ -253,24 +330,29 @@ def build_focus_pull_example(
         rig.parm("near").set(0.1)
         rig.parm("far").set(100000)
 
+    rig_set = parm_setter(rig)
+
     # Starting position: slightly elevated, looking down corridor
-    if rig.parm("ty"):
-        rig.parm("ty").set(0.6)
+    rig_set("ty", 0.6)
 
     # ── 9. Animate camera -- dolly + pan ──────────────────
     # Dolly forward: z=4 -> z=2 over 120 frames (slow push)
     tz_parm = rig.parm("tz")
     if tz_parm:
+        keys = []
+        add_key(keys, 1, 4.0)
+        add_key(keys, 120, 2.0)
         tz_parm.deleteAllKeyframes()
-        set_key(tz_parm, 1, 4.0)
-        set_key(tz_parm, 120, 2.0)
+        tz_parm.setKeyframes(keys)
 
     # Subtle pan right: ry=0 -> ry=4 (reveals flare sources)
     ry_parm = rig.parm("ry")
     if ry_parm:
+        keys = []
+        add_key(keys, 1, 0.0)
+        add_key(keys, 120, 4.0)
         ry_parm.deleteAllKeyframes()
-        set_key(ry_parm, 1, 0.0)
-        set_key(ry_parm, 120, 4.0)
+        ry_parm.setKeyframes(keys)
 
     # ── 10. Animate focus -- rack far to near ─────────────
     # Three-beat focus rack:
@@ -278,141 +360,99 @@ def build_focus_pull_example(
     #   Frames 41-80:  Rack to foreground sphere (1.5m)
     #   Frames 81-120: Hold on foreground
     # The rack is where squeeze breathing becomes visible
-    focus_parm = None
-    if rig.parm("focus_distance_m"):
-        focus_parm = rig.parm("focus_distance_m")
-    elif rig.parm("focus"):
-        focus_parm = rig.parm("focus")
+    focus_parm = rig.parm("focus_distance_m") or rig.parm("focus")
 
     if focus_parm:
+        keys = []
+        add_key(keys, 1, 12.0)     # Hold on hero torus
+        add_key(keys, 40, 12.0)    # Still holding
+        add_key(keys, 80, 1.5)     # Racked to foreground
+        add_key(keys, 120, 1.5)    # Hold on foreground
         focus_parm.deleteAllKeyframes()
-        set_key(focus_parm, 1, 12.0)    # Hold on hero torus
-        set_key(focus_parm, 40, 12.0)   # Still holding
-        set_key(focus_parm, 80, 1.5)    # Racked to foreground
-        set_key(focus_parm, 120, 1.5)   # Hold on foreground
+        focus_parm.setKeyframes(keys)
 
     # ── 11. Enable all rig features ───────────────────────
     # Biomechanics: makes the dolly/pan feel like a real operator
-    if rig.parm("enable_biomechanics"):
-        rig.parm("enable_biomechanics").set(True)
+    rig_set("enable_biomechanics", True)
 
     # Handheld shake: subtle organic tremor
-    if rig.parm("enable_handheld"):
-        rig.parm("enable_handheld").set(True)
-    if rig.parm("shake_amplitude_deg"):
-        rig.parm("shake_amplitude_deg").set(0.15)
-    if rig.parm("shake_frequency_hz"):
-        rig.parm("shake_frequency_hz").set(5.5)
+    rig_set("enable_handheld", True)
+    rig_set("shake_amplitude_deg", 0.15)
+    rig_set("shake_frequency_hz", 5.5)
 
     # Anamorphic flare: enabled by default, lower threshold
     # to catch our emissive spheres
-    if rig.parm("enable_flare"):
-        rig.parm("enable_flare").set(True)
-    if rig.parm("flare_threshold"):
-        rig.parm("flare_threshold").set(2.0)
-    if rig.parm("flare_intensity"):
-        rig.parm("flare_intensity").set(0.5)
+    rig_set("enable_flare", True)
+    rig_set("flare_threshold", 2.0)
+    rig_set("flare_intensity", 0.5)
 
     # Sensor noise: subtle, physically based
-    if rig.parm("enable_sensor_noise"):
-        rig.parm("enable_sensor_noise").set(True)
+    rig_set("enable_sensor_noise", True)
 
     # ── 12. Karma render settings ─────────────────────────
-    rop = hou.node("/out")
     try:
-        karma = rop.createNode("karma", "karma_xpu")
-        if karma.parm("renderer"):
-            karma.parm("renderer").set("XPU")
-        if karma.parm("override_camerares"):
-            karma.parm("override_camerares").set(True)
-            karma.parm("res_overridex").set(1920)
-            karma.parm("res_overridey").set(1080)
-        elif karma.parm("res_fraction"):
-            karma.parm("res_fraction").set("specific")
-            if karma.parm("res_overridex"):
-                karma.parm("res_overridex").set(1920)
-                karma.parm("res_overridey").set(1080)
+        karma = out.createNode("karma", "karma_xpu")
+        karma_set = parm_setter(karma)
+        karma_set("renderer", "XPU")
+        if (karma_set("override_camerares", True)
+                or karma_set("res_fraction", "specific")):
+            karma_set("res_overridex", 1920)
+            karma_set("res_overridey", 1080)
         # Point to our camera's internal cam node
-        if karma.parm("camera"):
-            internal_cam = rig.path() + "/cinema_camera"
-            if hou.node(internal_cam):
-                karma.parm("camera").set(internal_cam)
-            else:
-                karma.parm("camera").set(rig.path())
-        if karma.parm("trange"):
-            karma.parm("trange").set(1)
-            karma.parm("f1").set(1)
-            karma.parm("f2").set(120)
-            karma.parm("f3").set(1)
+        internal_cam = rig.node("cinema_camera")
+        karma_set(
+            "camera",
+            internal_cam.path() if internal_cam else rig.path(),
+        )
+        if karma_set("trange", 1):
+            karma_set("f1", 1)
+            karma_set("f2", 120)
+            karma_set("f3", 1)
     except hou.OperationFailed:
         pass
 
     # ── 13. Sticky notes ──────────────────────────────────
-    note_overview = obj.createStickyNote("note_overview")
-    note_overview.setText(
-        "CINEMA CAMERA RIG v4.0 -- Anamorphic Demo\n"
-        "==========================================\n\n"
-        "Cooke Anamorphic /i S35 50mm on ALEXA 35\n"
-        "120 frames at 24fps (5 seconds)\n\n"
-        "WHAT TO WATCH FOR:\n\n"
-        "1. SQUEEZE BREATHING (frames 41-80)\n"
-        "   Watch 'Effective Squeeze' parm during the focus rack.\n"
-        "   Close focus = reduced squeeze = visible horizontal\n"
-        "   breathing on straight lines (mumps effect).\n\n"
-        "2. BIOMECHANICS\n"
-        "   The camera dollies forward and pans right.\n"
-        "   Spring/lag solver adds weight and subtle overshoot.\n"
-        "   Compare: disable 'Enable Biomechanics' to see the\n"
-        "   difference between raw keyframes and filtered motion.\n\n"
-        "3. HANDHELD SHAKE\n"
-        "   Subtle 0.15-degree tremor at 5.5 Hz.\n"
-        "   Toggle 'Enable Handheld Shake' to compare.\n\n"
-        "4. ANAMORPHIC FLARE\n"
-        "   Bright spheres at z=-14 trigger horizontal streaks.\n"
-        "   Visible in rendered output (COP post-processing).\n\n"
-        "5. ENTRANCE PUPIL\n"
-        "   Yellow-orange circle guide visible on the null\n"
-        "   inside the HDA. Shows the nodal point for\n"
-        "   parallax-correct panning."
-    )
-    note_overview.setPosition(hou.Vector2(-8, 4))
-    note_overview.setSize(hou.Vector2(6, 7))
-    note_overview.setColor(hou.Color(0.95, 0.9, 0.7))
-
-    note_scene = obj.createStickyNote("note_scene")
-    note_scene.setText(
-        "SCENE LAYOUT\n"
-        "============\n\n"
-        "Foreground sphere  z = -1.5  (focus destination)\n"
-        "Mid-ground pillars z = -5.0  (depth framing)\n"
-        "Hero torus         z = -8.0  (focus origin)\n"
-        "Flare sources      z = -14.0 (bright highlights)\n\n"
-        "Camera dollies z=4 -> z=2 with ry=0 -> ry=4 pan.\n"
-        "Focus racks from 12m (hero) to 1.5m (foreground)\n"
-        "between frames 41-80."
-    )
-    note_scene.setPosition(hou.Vector2(-8, -4))
-    note_scene.setSize(hou.Vector2(6, 3.5))
-    note_scene.setColor(hou.Color(0.8, 0.9, 0.95))
-
-    note_render = obj.createStickyNote("note_render")
-    note_render.setText(
-        "RENDERING\n"
-        "=========\n\n"
-        "Karma XPU at /out/karma_xpu\n"
-        "1920x1080, frames 1-120\n\n"
-        "Camera points to internal cinema_camera node.\n"
-        "Cooke /i metadata written to EXR automatically.\n\n"
-        "For a quick preview: render frame 60\n"
-        "(mid-rack, both planes partially in focus)."
-    )
-    note_render.setPosition(hou.Vector2(-8, -8))
-    note_render.setSize(hou.Vector2(6, 2.8))
-    note_render.setColor(hou.Color(0.85, 0.95, 0.85))
-
-    # ── 14. Layout and save ───────────────────────────────
+    for name, text, pos, size, color in _NOTES:
+        note = obj.createStickyNote(name)
+        note.setText(text)
+        note.setPosition(_vec2(*pos))
+        note.setSize(_vec2(*size))
+        note.setColor(_color(*color))
+
+    # ── 14. Layout ────────────────────────────────────────
     obj.layoutChildren()
     hou.setFrame(1)
+
+
+def build_focus_pull_example(
+    save_path: str = None,
+) -> str:
+    """
+    Build the focus pull demo .hip file.
+
+    Returns: Absolute path to saved .hip file.
+    """
+    import hou
+
+    env_path = os.environ.get("CINEMA_CAMERA_PATH", "")
+    if save_path is None:
+        save_path = os.path.join(
+            env_path,
+            "examples",
+            "cinema_rig_focus_pull_example.hip",
+        )
+
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+    # Bulk build: no undo snapshots, no cook/redraw per edit
+    update_mode = hou.updateModeSetting()
+    hou.setUpdateMode(hou.updateMode.Manual)
+    try:
+        with hou.undos.disabler():
+            _build_scene(hou, env_path)
+    finally:
+        hou.setUpdateMode(update_mode)
+
     hou.hipFile.save(save_path)
 
     return save_path
@@ -0,0 +1,166 @@
+"""
+Cinema Camera Rig v4.0 — Shared Test Configuration
+
+Puts scripts/python on sys.path once per session and provides the
+frozen protocol fixtures shared across test modules.
+
+Tests marked ``usd`` are skipped when HOUDINI_USD=0, for environments
+where pxr is importable but USD tests are not wanted.
+"""
+
+import os
+import sys
+import pytest
+from pathlib import Path
+
+# Ensure cinema_camera package is importable
+_scripts_python = str(Path(__file__).resolve().parents[2] / "scripts" / "python")
+if _scripts_python not in sys.path:
+    sys.path.insert(0, _scripts_python)
+
+from cinema_camera.protocols import (
+    BreathingCurve,
+    CameraState,
+    DistortionModel,
+    FormatSpec,
+    GearRingSpec,
+    LensSpec,
+    MechanicalSpec,
+    SensorSpec,
+    SqueezeBreathingCurve,
+)
+
+
+# ── USD gating ─────────────────────────────────────────────
+
+_USD_DISABLED = os.environ.get("HOUDINI_USD") == "0"
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "usd: requires the pxr (USD) module; skipped when HOUDINI_USD=0"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not _USD_DISABLED:
+        return
+    skip_usd = pytest.mark.skip(reason="USD tests disabled (HOUDINI_USD=0)")
+    for item in items:
+        if "usd" in item.keywords:
+            item.add_marker(skip_usd)
+
+
+# ── Shared immutable test data ─────────────────────────────
+# Frozen dataclasses, built once at import and shared by every test.
+
+_FOCUS_RING = GearRingSpec(rotation_deg=300.0, gear_teeth=140, gear_module=0.8)
+_IRIS_RING = GearRingSpec(rotation_deg=90.0, gear_teeth=134, gear_module=0.8)
+
+_SQUEEZE_CURVE = SqueezeBreathingCurve(
+    points=(
+        (0.85, 1.85),
+        (1.5, 1.92),
+        (3.0, 1.97),
+        (10.0, 1.99),
+        (1e10, 2.0),
+    ),
+    nominal_squeeze=2.0,
+)
+
+_CAMERA_STATE = CameraState(
+    model="ARRI ALEXA 35",
+    sensor=SensorSpec(width_mm=27.99, height_mm=19.22, native_iso=800),
+    format=FormatSpec(4608, 3164),
+    exposure_index=800,
+    shutter_angle_deg=180.0,
+)
+
+
+# ── Fixtures ───────────────────────────────────────────────
+
+@pytest.fixture(scope="session")
+def focus_ring():
+    return _FOCUS_RING
+
+
+@pytest.fixture(scope="session")
+def iris_ring():
+    return _IRIS_RING
+
+
+@pytest.fixture(scope="module")
+def mechanical_spec(focus_ring, iris_ring):
+    return MechanicalSpec(
+        weight_kg=3.6,
+        length_mm=205.0,
+        front_diameter_mm=110.0,
+        filter_thread="M105x0.75",
+        focus_ring=focus_ring,
+        iris_ring=iris_ring,
+        entrance_pupil_offset_mm=125.0,
+    )
+
+
+@pytest.fixture(scope="session")
+def squeeze_curve():
+    return _SQUEEZE_CURVE
+
+
+@pytest.fixture(scope="module")
+def lens_spec_v4(mechanical_spec, squeeze_curve):
+    return LensSpec(
+        lens_id="cooke_ana_i_s35_50mm",
+        manufacturer="Cooke",
+        series="Anamorphic/i S35",
+        focal_length_mm=50.0,
+        t_stop_min=2.3,
+        t_stop_max=22.0,
+        iris_blades=11,
+        close_focus_m=0.85,
+        image_circle_mm=31.1,
+        squeeze_ratio=2.0,
+        distortion=DistortionModel(k1=-0.015, k2=0.002, squeeze_uniformity=0.94),
+        breathing=BreathingCurve(((0.85, 3.2), (2.0, 1.1), (1e10, 0.0))),
+        mechanics=mechanical_spec,
+        squeeze_breathing=squeeze_curve,
+    )
+
+
+@pytest.fixture(scope="module")
+def lens_spec_v3():
+    """v3.0 LensSpec without mechanical data -- backwards compat."""
+    return LensSpec(
+        lens_id="test_spherical_50mm",
+        manufacturer="Test",
+        series="Spherical",
+        focal_length_mm=50.0,
+        t_stop_min=1.4,
+        t_stop_max=22.0,
+        iris_blades=9,
+        close_focus_m=0.45,
+        image_circle_mm=43.3,
+        squeeze_ratio=1.0,
+        distortion=DistortionModel(k1=-0.01),
+        breathing=BreathingCurve(),
+    )
+
+
+@pytest.fixture(scope="session")
+def camera_state():
+    return _CAMERA_STATE
+
+
+@pytest.fixture(scope="session")
+def lens_catalog():
+    """Lens JSON files under cinema_camera/lenses keyed by stem, listed once."""
+    lenses_dir = Path(__file__).resolve().parents[1] / "lenses"
+    try:
+        with os.scandir(lenses_dir) as it:
+            return {
+                e.name[:-5]: Path(e.path)
+                for e in it
+                if e.name.endswith(".json") and e.is_file()
+            }
+    except FileNotFoundError:
+        return {}
@@ -5,18 +5,9 @@ Validates derive_biomechanics() produces correct solver parameters
 for different rig weights.
 """
 
-import sys
-import os
+import numpy as np
 import pytest
 
-# Ensure cinema_camera package is importable
-_scripts_python = os.path.join(
-    os.path.dirname(__file__), "..", "..", "scripts", "python"
-)
-_scripts_python = os.path.normpath(_scripts_python)
-if _scripts_python not in sys.path:
-    sys.path.insert(0, _scripts_python)
-
 from cinema_camera.protocols import (
     BreathingCurve,
     CameraState,
@@ -29,10 +20,14 @@ from cinema_camera.protocols import (
     SensorSpec,
     SqueezeBreathingCurve,
 )
-from cinema_camera.biomechanics import BiomechanicsParams, derive_biomechanics
+from cinema_camera.biomechanics import (
+    BiomechanicsParams,
+    derive_biomechanics,
+    derive_biomechanics_batch,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def camera_state():
     return CameraState(
         model="ARRI ALEXA 35",
@@ -69,77 +64,88 @@ def _make_lens_state(focal_mm, weight_kg, length_mm, close_focus_m=0.85):
     return LensState(spec=spec, t_stop=2.8, focus_distance_m=2.0)
 
 
+@pytest.fixture(scope="module")
+def light_lens():
+    """50mm Cooke, 3.6kg."""
+    return _make_lens_state(50.0, 3.6, 205.0)
+
+
+@pytest.fixture(scope="module")
+def heavy_lens():
+    """300mm Cooke, 9.4kg."""
+    return _make_lens_state(300.0, 9.4, 460.0, close_focus_m=1.83)
+
+
+@pytest.fixture(scope="module")
+def light_params(camera_state, light_lens):
+    return derive_biomechanics(camera_state, light_lens)
+
+
+@pytest.fixture(scope="module")
+def heavy_params(camera_state, heavy_lens):
+    return derive_biomechanics(camera_state, heavy_lens)
+
+
 class TestBiomechanics50mm:
     """50mm Cooke at 3.6kg on Alexa 35 (3.9kg) = 7.5kg rig."""
 
-    def test_combined_weight(self, camera_state):
-        lens_state = _make_lens_state(50.0, 3.6, 205.0)
-        params = derive_biomechanics(camera_state, lens_state)
-        assert params.combined_weight_kg == pytest.approx(7.5)
+    def test_combined_weight(self, light_params):
+        assert light_params.combined_weight_kg == pytest.approx(7.5)
 
-    def test_spring_constant(self, camera_state):
-        lens_state = _make_lens_state(50.0, 3.6, 205.0)
-        params = derive_biomechanics(camera_state, lens_state)
+    def test_spring_constant(self, light_params):
         # Light rig: spring_k should be relatively high (~15)
-        assert 10.0 < params.spring_constant < 20.0
+        assert 10.0 < light_params.spring_constant < 20.0
 
-    def test_damping_ratio(self, camera_state):
-        lens_state = _make_lens_state(50.0, 3.6, 205.0)
-        params = derive_biomechanics(camera_state, lens_state)
+    def test_damping_ratio(self, light_params):
         # Light rig: moderate damping
-        assert 0.4 < params.damping_ratio < 0.8
+        assert 0.4 < light_params.damping_ratio < 0.8
 
-    def test_handheld_amplitude(self, camera_state):
-        lens_state = _make_lens_state(50.0, 3.6, 205.0)
-        params = derive_biomechanics(camera_state, lens_state)
+    def test_handheld_amplitude(self, light_params):
         # Lighter rig = more shake
-        assert params.handheld_amplitude_deg > 0.1
+        assert light_params.handheld_amplitude_deg > 0.1
 
 
 class TestBiomechanics300mm:
     """300mm Cooke at 9.4kg on Alexa 35 (3.9kg) = 13.3kg rig."""
 
-    def test_combined_weight(self, camera_state):
-        lens_state = _make_lens_state(300.0, 9.4, 460.0, close_focus_m=1.83)
-        params = derive_biomechanics(camera_state, lens_state)
-        assert params.combined_weight_kg == pytest.approx(13.3)
+    def test_combined_weight(self, heavy_params):
+        assert heavy_params.combined_weight_kg == pytest.approx(13.3)
 
-    def test_spring_constant_lower_than_50mm(self, camera_state):
-        light = derive_biomechanics(
-            camera_state, _make_lens_state(50.0, 3.6, 205.0)
-        )
-        heavy = derive_biomechanics(
-            camera_state, _make_lens_state(300.0, 9.4, 460.0, close_focus_m=1.83)
-        )
+    def test_spring_constant_lower_than_50mm(self, light_params, heavy_params):
         # Heavy rig has lower spring constant (slower response)
-        assert heavy.spring_constant < light.spring_constant
+        assert heavy_params.spring_constant < light_params.spring_constant
 
-    def test_damping_higher_than_50mm(self, camera_state):
-        light = derive_biomechanics(
-            camera_state, _make_lens_state(50.0, 3.6, 205.0)
-        )
-        heavy = derive_biomechanics(
-            camera_state, _make_lens_state(300.0, 9.4, 460.0, close_focus_m=1.83)
-        )
+    def test_damping_higher_than_50mm(self, light_params, heavy_params):
         # Heavy rig has more damping
-        assert heavy.damping_ratio > light.damping_ratio
+        assert heavy_params.damping_ratio > light_params.damping_ratio
 
-    def test_handheld_less_than_50mm(self, camera_state):
-        light = derive_biomechanics(
-            camera_state, _make_lens_state(50.0, 3.6, 205.0)
-        )
-        heavy = derive_biomechanics(
-            camera_state, _make_lens_state(300.0, 9.4, 460.0, close_focus_m=1.83)
-        )
+    def test_handheld_less_than_50mm(self, light_params, heavy_params):
         # Heavy rig = less shake
-        assert heavy.handheld_amplitude_deg < light.handheld_amplitude_deg
+        assert heavy_params.handheld_amplitude_deg < light_params.handheld_amplitude_deg
 
-    def test_lag_higher_than_50mm(self, camera_state):
-        light = derive_biomechanics(
-            camera_state, _make_lens_state(50.0, 3.6, 205.0)
-        )
-        heavy = derive_biomechanics(
-            camera_state, _make_lens_state(300.0, 9.4, 460.0, close_focus_m=1.83)
-        )
+    def test_lag_higher_than_50mm(self, light_params, heavy_params):
         # Heavy rig = more lag
-        assert heavy.lag_frames > light.lag_frames
+        assert heavy_params.lag_frames > light_params.lag_frames
+
+
+class TestBiomechanicsBatch:
+    """Vectorized derivation matches the scalar path field for field."""
+
+    def test_matches_scalar(self, light_params, heavy_params):
+        # Moment arm = 8cm sensor offset + half lens length
+        batch = derive_biomechanics_batch(
+            [7.5, 13.3], [8.0 + 205.0 / 20.0, 8.0 + 460.0 / 20.0]
+        )
+        for i, params in enumerate((light_params, heavy_params)):
+            for name, value in params._asdict().items():
+                assert batch[name][i] == pytest.approx(value)
+
+    def test_broadcasts_scalar_arm(self):
+        batch = derive_biomechanics_batch(np.linspace(5.0, 20.0, 16), 12.0)
+        assert batch["moment_of_inertia"].shape == (16,)
+        assert np.all(np.diff(batch["spring_constant"]) <= 0.0)
+
+    @pytest.mark.parametrize("weights", [[7.5, 0.0], [-1.0], 0.0])
+    def test_rejects_non_positive_weight(self, weights):
+        with pytest.raises(ValueError, match="Invalid combined rig weight"):
+            derive_biomechanics_batch(weights, 12.0)
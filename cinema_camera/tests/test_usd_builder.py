@@ -8,24 +8,24 @@ Validates:
 - Backwards-compatible build_usd_camera wrapper
 
 These tests use the pxr module (USD) and require hython or a USD-enabled
-Python environment. When run under standard pytest without pxr, they skip.
+Python environment. When run under standard pytest without pxr, or with
+HOUDINI_USD=0, they skip.
 """
 
 from __future__ import annotations
 
-import sys
-
 import pytest
 
+# HOUDINI_USD=0 skips everything marked usd (see conftest.py)
+pytestmark = pytest.mark.usd
+
 # Skip entire module if pxr is not available
 pxr = pytest.importorskip("pxr", reason="pxr (USD) not available -- run with hython or USD-enabled Python")
 
 from pxr import Gf, Sdf, Usd, UsdGeom, UsdRender, UsdShade
 
-# Add scripts/python to path for cinema_camera imports
-sys.path.insert(0, str(__import__("pathlib").Path(__file__).resolve().parents[2] / "scripts" / "python"))
-
 from cinema_camera.protocols import (
+    DISTORTION_COEFFS_LAYOUT,
     BreathingCurve,
     CameraState,
     DistortionModel,
@@ -44,15 +44,17 @@ from cinema_camera.usd_builder import (
     build_usd_camera,
     build_usd_camera_rig,
     configure_render_product,
+    get_cached_stage,
+    release_cached_stage,
 )
-from cinema_camera.karma_lens_shader import bind_lens_shader
+from cinema_camera.karma_lens_shader import LENS_COEFFS_LAYOUT, _lens_coeffs, bind_lens_shader
 
 
 # ════════════════════════════════════════════════════════════
 # FIXTURES
 # ════════════════════════════════════════════════════════════
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def alexa35_camera() -> CameraState:
     return CameraState(
         model="ARRI ALEXA 35",
@@ -64,7 +66,7 @@ def alexa35_camera() -> CameraState:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def komodo_camera() -> CameraState:
     return CameraState(
         model="RED KOMODO",
@@ -106,17 +108,17 @@ def _make_cooke_50mm_spec() -> LensSpec:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cooke_50mm_spec() -> LensSpec:
     return _make_cooke_50mm_spec()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def lens_state_50mm(cooke_50mm_spec) -> LensState:
     return LensState(spec=cooke_50mm_spec, t_stop=2.8, focus_distance_m=3.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def optical_result() -> OpticalResult:
     return OpticalResult(
         hfov_deg=30.5, vfov_deg=21.0,
@@ -125,11 +127,18 @@ def optical_result() -> OpticalResult:
     )
 
 
-@pytest.fixture
-def stage() -> Usd.Stage:
+@pytest.fixture(scope="module")
+def _shared_stage() -> Usd.Stage:
     return Usd.Stage.CreateInMemory()
 
 
+@pytest.fixture
+def stage(_shared_stage) -> Usd.Stage:
+    """One in-memory stage per module, emptied before each test."""
+    _shared_stage.GetRootLayer().Clear()
+    return _shared_stage
+
+
 # ════════════════════════════════════════════════════════════
 # PILLAR B: USD RIG HIERARCHY
 # ════════════════════════════════════════════════════════════
@@ -161,6 +170,13 @@ class TestRigHierarchy:
         assert len(ops) >= 1
         assert "rotateXYZ" in ops[0].GetOpName()
 
+    def test_incompatible_op_stack_raises(self, stage, alexa35_camera, lens_state_50mm, optical_result):
+        # A reused stage whose FluidHead already carries a matrix op
+        head = UsdGeom.Xform.Define(stage, "/World/CameraRig/FluidHead")
+        head.AddTransformOp()
+        with pytest.raises(ValueError, match="/World/CameraRig/FluidHead"):
+            build_usd_camera_rig(stage, "/World/CameraRig", alexa35_camera, lens_state_50mm, optical_result)
+
     def test_entrance_pupil_is_guide(self, stage, alexa35_camera, lens_state_50mm, optical_result):
         build_usd_camera_rig(stage, "/World/CameraRig", alexa35_camera, lens_state_50mm, optical_result)
         pupil = stage.GetPrimAtPath("/World/CameraRig/FluidHead/Body/Sensor/EntrancePupil")
@@ -188,21 +204,19 @@ class TestEntrancePupilOffset:
 class TestBodyOffset:
     """Validate per-camera body offsets."""
 
-    def test_alexa35_offset(self, stage, alexa35_camera, lens_state_50mm, optical_result):
-        build_usd_camera_rig(stage, "/World/Rig", alexa35_camera, lens_state_50mm, optical_result)
+    @pytest.mark.parametrize("camera_fixture, y, z", [
+        ("alexa35_camera", 5.0, -8.0),
+        ("komodo_camera", 3.5, -5.0),
+    ], ids=["alexa35", "komodo"])
+    def test_known_camera_offset(self, request, stage, lens_state_50mm, optical_result,
+                                 camera_fixture, y, z):
+        camera = request.getfixturevalue(camera_fixture)
+        build_usd_camera_rig(stage, "/World/Rig", camera, lens_state_50mm, optical_result)
         body = UsdGeom.Xform(stage.GetPrimAtPath("/World/Rig/FluidHead/Body"))
         ops = body.GetOrderedXformOps()
         translate = ops[0].Get()
-        assert translate[1] == pytest.approx(5.0)   # ARRI ALEXA 35 y=5.0
-        assert translate[2] == pytest.approx(-8.0)   # z=-8.0
-
-    def test_komodo_offset(self, stage, komodo_camera, lens_state_50mm, optical_result):
-        build_usd_camera_rig(stage, "/World/Rig", komodo_camera, lens_state_50mm, optical_result)
-        body = UsdGeom.Xform(stage.GetPrimAtPath("/World/Rig/FluidHead/Body"))
-        ops = body.GetOrderedXformOps()
-        translate = ops[0].Get()
-        assert translate[1] == pytest.approx(3.5)    # RED KOMODO y=3.5
-        assert translate[2] == pytest.approx(-5.0)
+        assert translate[1] == pytest.approx(y)
+        assert translate[2] == pytest.approx(z)
 
     def test_unknown_camera_uses_default(self, stage, lens_state_50mm, optical_result):
         unknown_cam = CameraState(
@@ -214,8 +228,33 @@ class TestBodyOffset:
         body = UsdGeom.Xform(stage.GetPrimAtPath("/World/Rig/FluidHead/Body"))
         ops = body.GetOrderedXformOps()
         translate = ops[0].Get()
-        assert translate[1] == pytest.approx(_DEFAULT_BODY_OFFSET["y"])
-        assert translate[2] == pytest.approx(_DEFAULT_BODY_OFFSET["z"])
+        assert translate[1] == pytest.approx(_DEFAULT_BODY_OFFSET.y)
+        assert translate[2] == pytest.approx(_DEFAULT_BODY_OFFSET.z)
+
+
+class TestStageCache:
+    """Validate shared in-memory stages in UsdUtils.StageCache."""
+
+    def test_same_name_returns_cached_stage(self, alexa35_camera, lens_state_50mm, optical_result):
+        stage = get_cached_stage("test_rig_shared")
+        try:
+            build_usd_camera_rig(stage, "/World/Rig", alexa35_camera, lens_state_50mm, optical_result)
+            again = get_cached_stage("test_rig_shared")
+            assert again == stage
+            assert again.GetPrimAtPath("/World/Rig/FluidHead/Body/Sensor").IsValid()
+        finally:
+            assert release_cached_stage("test_rig_shared") is True
+        assert release_cached_stage("test_rig_shared") is False
+
+    def test_release_gives_fresh_stage(self):
+        stage = get_cached_stage("test_rig_fresh")
+        stage.DefinePrim("/Leftover")
+        release_cached_stage("test_rig_fresh")
+        fresh = get_cached_stage("test_rig_fresh")
+        try:
+            assert not fresh.GetPrimAtPath("/Leftover")
+        finally:
+            release_cached_stage("test_rig_fresh")
 
 
 class TestCameraAttributes:
@@ -270,6 +309,16 @@ class TestBackwardsCompat:
 # PILLAR E: EXR METADATA
 # ════════════════════════════════════════════════════════════
 
+@pytest.fixture(scope="module")
+def alexa_product(alexa35_camera, lens_state_50mm):
+    """Render product on its own stage, built once and only read by tests."""
+    product_stage = Usd.Stage.CreateInMemory()  # held open by the generator
+    yield configure_render_product(
+        product_stage, "/World/Camera", "/renders/shot.exr",
+        alexa35_camera, lens_state_50mm,
+    )
+
+
 class TestEXRMetadata:
     """Validate Render Product EXR metadata attributes."""
 
@@ -282,59 +331,32 @@ class TestEXRMetadata:
         )
         assert product.GetPrim().IsValid()
 
-    def test_resolution(self, stage, alexa35_camera, lens_state_50mm):
-        product = configure_render_product(
-            stage, "/World/Camera", "/renders/shot.exr",
-            alexa35_camera, lens_state_50mm,
-        )
-        res = product.GetResolutionAttr().Get()
+    def test_resolution(self, alexa_product):
+        res = alexa_product.GetResolutionAttr().Get()
         assert res == Gf.Vec2i(4608, 3164)
 
-    def test_camera_metadata(self, stage, alexa35_camera, lens_state_50mm):
-        product = configure_render_product(
-            stage, "/World/Camera", "/renders/shot.exr",
-            alexa35_camera, lens_state_50mm,
-        )
-        prim = product.GetPrim()
-        assert prim.GetAttribute("driver:parameters:OpenEXR:camera:model").Get() == "ARRI ALEXA 35"
-        assert prim.GetAttribute("driver:parameters:OpenEXR:camera:sensorWidthMm").Get() == pytest.approx(27.99)
-        assert prim.GetAttribute("driver:parameters:OpenEXR:camera:exposureIndex").Get() == 800
-        assert prim.GetAttribute("driver:parameters:OpenEXR:camera:colorScience").Get() == "ARRI LogC4"
-
-    def test_lens_metadata(self, stage, alexa35_camera, lens_state_50mm):
-        product = configure_render_product(
-            stage, "/World/Camera", "/renders/shot.exr",
-            alexa35_camera, lens_state_50mm,
-        )
-        prim = product.GetPrim()
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:manufacturer").Get() == "Cooke"
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:focalLengthMm").Get() == pytest.approx(50.0)
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:tStop").Get() == pytest.approx(2.8)
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:irisBlades").Get() == 11
-
-    def test_distortion_metadata(self, stage, alexa35_camera, lens_state_50mm):
-        product = configure_render_product(
-            stage, "/World/Camera", "/renders/shot.exr",
-            alexa35_camera, lens_state_50mm,
-        )
-        prim = product.GetPrim()
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:distortion:k1").Get() == pytest.approx(-0.038)
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:distortion:p2").Get() == pytest.approx(-0.001)
-
-    def test_mechanical_metadata_present(self, stage, alexa35_camera, lens_state_50mm):
-        product = configure_render_product(
-            stage, "/World/Camera", "/renders/shot.exr",
-            alexa35_camera, lens_state_50mm,
-        )
-        prim = product.GetPrim()
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:entrancePupilOffsetMm").Get() == pytest.approx(125.0)
-        assert prim.GetAttribute("driver:parameters:OpenEXR:lens:weightKg").Get() == pytest.approx(3.6)
-
-    def test_squeeze_reflects_focus_distance(self, stage, alexa35_camera):
+    @pytest.mark.parametrize("attr, expected", [
+        ("camera:model", "ARRI ALEXA 35"),
+        ("camera:sensorWidthMm", pytest.approx(27.99)),
+        ("camera:exposureIndex", 800),
+        ("camera:colorScience", "ARRI LogC4"),
+        ("lens:manufacturer", "Cooke"),
+        ("lens:focalLengthMm", pytest.approx(50.0)),
+        ("lens:tStop", pytest.approx(2.8)),
+        ("lens:irisBlades", 11),
+        ("lens:distortion:k1", pytest.approx(-0.038)),
+        ("lens:distortion:p2", pytest.approx(-0.001)),
+        ("lens:entrancePupilOffsetMm", pytest.approx(125.0)),
+        ("lens:weightKg", pytest.approx(3.6)),
+    ])
+    def test_metadata(self, alexa_product, attr, expected):
+        prim = alexa_product.GetPrim()
+        assert prim.GetAttribute(f"driver:parameters:OpenEXR:{attr}").Get() == expected
+
+    def test_squeeze_reflects_focus_distance(self, stage, alexa35_camera, cooke_50mm_spec):
         """Effective squeeze in metadata should reflect the focus distance, not nominal."""
-        spec = _make_cooke_50mm_spec()
-        ls_close = LensState(spec=spec, t_stop=2.8, focus_distance_m=0.85)
-        ls_far = LensState(spec=spec, t_stop=2.8, focus_distance_m=1e6)
+        ls_close = LensState(spec=cooke_50mm_spec, t_stop=2.8, focus_distance_m=0.85)
+        ls_far = LensState(spec=cooke_50mm_spec, t_stop=2.8, focus_distance_m=1e6)
 
         prod_close = configure_render_product(
             stage, "/World/CamClose", "/renders/close.exr",
@@ -361,6 +383,10 @@ class TestEXRMetadata:
 # PILLAR D: SHADER BINDING
 # ════════════════════════════════════════════════════════════
 
+def _coeff(coeffs, name):
+    return coeffs[LENS_COEFFS_LAYOUT.index(name)]
+
+
 class TestShaderBinding:
     """Validate Karma CVEX lens shader binding."""
 
@@ -373,27 +399,99 @@ class TestShaderBinding:
     def test_shader_inputs(self, stage, alexa35_camera, lens_state_50mm):
         UsdGeom.Camera.Define(stage, "/World/Camera")
         shader = bind_lens_shader(stage, "/World/Camera", alexa35_camera, lens_state_50mm)
-        assert shader.GetInput("focal_length_mm").Get() == pytest.approx(50.0)
-        assert shader.GetInput("sensor_width_mm").Get() == pytest.approx(27.99)
-        assert shader.GetInput("dist_k1").Get() == pytest.approx(-0.038)
-        assert shader.GetInput("dist_sq_uniformity").Get() == pytest.approx(0.92)
+        coeffs = shader.GetInput("lens_coeffs").Get()
+        assert len(coeffs) == len(LENS_COEFFS_LAYOUT)
+        assert _coeff(coeffs, "focal_length_mm") == pytest.approx(50.0)
+        assert _coeff(coeffs, "sensor_width_mm") == pytest.approx(27.99)
+        assert _coeff(coeffs, "dist_k1") == pytest.approx(-0.038)
+        assert _coeff(coeffs, "dist_sq_uniformity") == pytest.approx(0.92)
+
+    def test_single_coeffs_input(self, stage, alexa35_camera, lens_state_50mm):
+        UsdGeom.Camera.Define(stage, "/World/Camera")
+        shader = bind_lens_shader(stage, "/World/Camera", alexa35_camera, lens_state_50mm)
+        assert [i.GetBaseName() for i in shader.GetInputs()] == ["lens_coeffs"]
+        assert shader.GetInput("lens_coeffs").GetTypeName() == Sdf.ValueTypeNames.FloatArray
 
     def test_shader_squeeze_from_lens_state(self, stage, alexa35_camera, lens_state_50mm):
         UsdGeom.Camera.Define(stage, "/World/Camera")
         shader = bind_lens_shader(stage, "/World/Camera", alexa35_camera, lens_state_50mm)
-        squeeze = shader.GetInput("effective_squeeze").Get()
+        squeeze = _coeff(shader.GetInput("lens_coeffs").Get(), "effective_squeeze")
         # At 3.0m focus, squeeze is interpolated (not nominal 2.0)
         assert 1.9 < squeeze < 2.0
 
     def test_shader_pupil_offset(self, stage, alexa35_camera, lens_state_50mm):
         UsdGeom.Camera.Define(stage, "/World/Camera")
         shader = bind_lens_shader(stage, "/World/Camera", alexa35_camera, lens_state_50mm)
-        offset = shader.GetInput("entrance_pupil_offset_cm").Get()
+        offset = _coeff(shader.GetInput("lens_coeffs").Get(), "entrance_pupil_offset_cm")
         assert offset == pytest.approx(12.5, abs=0.01)
 
+    def test_coeffs_are_immutable(self, alexa35_camera, lens_state_50mm):
+        coeffs = _lens_coeffs(alexa35_camera, lens_state_50mm)
+        assert isinstance(coeffs, tuple)
+        assert len(coeffs) == len(LENS_COEFFS_LAYOUT)
+
     def test_camera_shader_binding_attr(self, stage, alexa35_camera, lens_state_50mm):
         UsdGeom.Camera.Define(stage, "/World/Camera")
         bind_lens_shader(stage, "/World/Camera", alexa35_camera, lens_state_50mm)
         cam_prim = stage.GetPrimAtPath("/World/Camera")
         shader_path = cam_prim.GetAttribute("karma:lens:shader").Get()
         assert shader_path == "/World/Camera/CinemaLensShader"
+
+
+class _ZeroFill(dict):
+    def __missing__(self, key):
+        return "0"
+
+
+class TestDistortionCoeffs:
+    """Both builders pack distortion into cinema:lens:distortionCoeffs in
+    DISTORTION_COEFFS_LAYOUT order, matching the shader's dist_* tail of
+    LENS_COEFFS_LAYOUT; usd_builder keeps the scalar attributes too."""
+
+    SHADER_SLICE = slice(
+        LENS_COEFFS_LAYOUT.index("dist_k1"),
+        LENS_COEFFS_LAYOUT.index("dist_k1") + len(DISTORTION_COEFFS_LAYOUT),
+    )
+
+    def test_layout_lines_up_with_shader(self):
+        assert LENS_COEFFS_LAYOUT[self.SHADER_SLICE] == (
+            "dist_k1", "dist_k2", "dist_k3", "dist_p1", "dist_p2", "dist_sq_uniformity",
+        )
+
+    def test_usd_builder_packed_layout(self, stage, alexa35_camera, lens_state_50mm, optical_result):
+        build_usd_camera_rig(stage, "/World/Rig", alexa35_camera, lens_state_50mm, optical_result)
+        sensor = stage.GetPrimAtPath("/World/Rig/FluidHead/Body/Sensor")
+        attr = sensor.GetAttribute("cinema:lens:distortionCoeffs")
+        assert attr.GetTypeName() == Sdf.ValueTypeNames.FloatArray
+        assert tuple(attr.GetCustomDataByKey("layout")) == DISTORTION_COEFFS_LAYOUT
+
+    def test_usd_builder_keeps_scalars(self, stage, alexa35_camera, lens_state_50mm, optical_result):
+        build_usd_camera_rig(stage, "/World/Rig", alexa35_camera, lens_state_50mm, optical_result)
+        sensor = stage.GetPrimAtPath("/World/Rig/FluidHead/Body/Sensor")
+        packed = sensor.GetAttribute("cinema:lens:distortionCoeffs").Get()
+        scalars = [
+            sensor.GetAttribute(f"cinema:lens:distortion:{name}").Get()
+            for name in DISTORTION_COEFFS_LAYOUT
+        ]
+        assert list(packed) == pytest.approx(scalars)
+        assert sensor.GetAttribute("cinema:lens:distortion:k1").Get() == pytest.approx(-0.038)
+
+    def test_usd_builder_values_match_shader(self, stage, alexa35_camera, lens_state_50mm, optical_result):
+        cam = build_usd_camera_rig(stage, "/World/Rig", alexa35_camera, lens_state_50mm, optical_result)
+        shader = bind_lens_shader(stage, str(cam.GetPath()), alexa35_camera, lens_state_50mm)
+        packed = cam.GetPrim().GetAttribute("cinema:lens:distortionCoeffs").Get()
+        coeffs = shader.GetInput("lens_coeffs").Get()
+        assert list(packed) == pytest.approx(list(coeffs[self.SHADER_SLICE]))
+
+    def test_lop_template_packed_layout(self):
+        from importlib.resources import files
+        from string import Template
+
+        text = files("cinema_camera.builders._lop_src").joinpath("camera_rig.usda").read_text()
+        layer = Sdf.Layer.CreateAnonymous(".usda")
+        assert layer.ImportFromString(Template(text).substitute(_ZeroFill()))
+        attr = layer.GetAttributeAtPath("/CinemaRig/FluidHead/Body/Sensor.cinema:lens:distortionCoeffs")
+        assert attr is not None
+        assert attr.typeName == Sdf.ValueTypeNames.FloatArray
+        assert tuple(attr.customData["layout"]) == DISTORTION_COEFFS_LAYOUT
+        assert len(attr.default) == len(DISTORTION_COEFFS_LAYOUT)
@@ -0,0 +1,59 @@
+"""
+Cinema Camera Rig v4.0 -- Compiled Curve Kernel
+
+Batched piecewise-linear curve lookup used by SqueezeBreathingCurve
+for array inputs. JIT-compiled with Numba when it is importable;
+otherwise SqueezeBreathingCurve uses np.interp and the same function
+stays available as plain Python, so Numba is an optional dependency.
+Scalar lookups never come here: a per-call dispatch into compiled code
+costs more than the lookup itself.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+
+def _eval_curve(xs: np.ndarray, ys: np.ndarray, ds: np.ndarray) -> np.ndarray:
+    """
+    Clamped linear interpolation of each of the 1-D queries ds over
+    sorted, non-empty knots.
+
+    Binary search keeps the invariant xs[lo] < d <= xs[hi], so a query
+    exactly on an interior knot resolves to the lower interval (t = 1),
+    matching np.searchsorted(side="left").
+    """
+    n = xs.shape[0]
+    out = np.empty(ds.shape[0])
+    for k in range(ds.shape[0]):
+        d = ds[k]
+        if d <= xs[0]:
+            out[k] = ys[0]
+            continue
+        if d >= xs[n - 1]:
+            out[k] = ys[n - 1]
+            continue
+        lo = 0
+        hi = n - 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if xs[mid] < d:
+                lo = mid
+            else:
+                hi = mid
+        x0 = xs[lo]
+        out[k] = ys[lo] + (d - x0) / (xs[hi] - x0) * (ys[hi] - ys[lo])
+    return out
+
+
+if HAVE_NUMBA:
+    eval_curve = numba.njit(cache=True)(_eval_curve)
+else:
+    eval_curve = _eval_curve
@@ -0,0 +1,57 @@
+"""
+Cinema Camera Rig v4.0 -- Compiled Rig Optics Kernel
+
+FOV / DOF / hyperfocal evaluation for the LOP HDA's rig cook script,
+which runs on every cook and parm scrub. JIT-compiled with Numba when
+it is importable; otherwise the same function runs as plain Python, so
+Numba stays an optional dependency.
+
+Same formulas as optics_engine (no breathing shift), but flattened to
+scalars and returning the 1e12 m far-limit sentinel the USD attributes
+use instead of inf.
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+
+def _rig_optics(
+    focal_length_mm: float,
+    t_stop: float,
+    focus_distance_m: float,
+    sensor_width_mm: float,
+    sensor_height_mm: float,
+) -> tuple[float, float, float, float, float, float]:
+    """
+    Returns (hfov_deg, vfov_deg, dof_near_m, dof_far_m, hyperfocal_m,
+    coc_mm). CoC is sensor diagonal / 1500; dof_far_m is 1e12 at or
+    beyond the hyperfocal distance.
+    """
+    inv_2f = 0.5 / focal_length_mm
+    hfov_deg = math.degrees(2.0 * math.atan(sensor_width_mm * inv_2f))
+    vfov_deg = math.degrees(2.0 * math.atan(sensor_height_mm * inv_2f))
+    coc_mm = math.hypot(sensor_width_mm, sensor_height_mm) / 1500.0
+    hyp_mm = focal_length_mm * focal_length_mm / (t_stop * coc_mm) + focal_length_mm
+    focus_mm = focus_distance_m * 1000.0
+    # Shared numerator of the near/far DOF limits
+    dof_num = focus_mm * (hyp_mm - focal_length_mm)
+    dof_near_m = max(0.0, dof_num / (hyp_mm + focus_mm - 2.0 * focal_length_mm) * 1e-3)
+    if focus_mm >= hyp_mm:
+        dof_far_m = 1e12
+    else:
+        dof_far_m = dof_num / (hyp_mm - focus_mm) * 1e-3
+    return hfov_deg, vfov_deg, dof_near_m, dof_far_m, hyp_mm * 1e-3, coc_mm
+
+
+if HAVE_NUMBA:
+    rig_optics = numba.njit(cache=True)(_rig_optics)
+else:
+    rig_optics = _rig_optics
@@ -0,0 +1,86 @@
+"""
+Cinema Camera Rig v4.0 -- Dataclass Serializer
+
+Minimal to_dict() / from_dict() for the frozen protocol dataclasses,
+used to ship specs to Houdini nodes and across the Synapse bridge as
+plain JSON-compatible dicts.
+
+Walks dataclasses.fields() directly and constructs through the class
+constructor, so __post_init__ validation still runs. Per-class field
+plans (init fields + resolved type hints) are computed once and cached.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import types
+import typing
+from typing import Any, Union
+
+# cls -> ((field_name, type_hint), ...) for init=True fields only
+_FIELD_PLANS: dict[type, tuple[tuple[str, Any], ...]] = {}
+
+
+def _field_plan(cls: type) -> tuple[tuple[str, Any], ...]:
+    """Constructor fields of a dataclass with their resolved type hints."""
+    plan = _FIELD_PLANS.get(cls)
+    if plan is None:
+        hints = typing.get_type_hints(cls)
+        plan = tuple(
+            (f.name, hints.get(f.name, Any))
+            for f in dataclasses.fields(cls)
+            if f.init
+        )
+        _FIELD_PLANS[cls] = plan
+    return plan
+
+
+def to_dict(obj: Any) -> Any:
+    """
+    Convert a dataclass (recursively) to JSON-compatible builtins.
+    Tuples become lists; derived init=False fields are omitted.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            name: to_dict(getattr(obj, name))
+            for name, _ in _field_plan(type(obj))
+        }
+    if isinstance(obj, (tuple, list)):
+        return [to_dict(x) for x in obj]
+    if isinstance(obj, dict):
+        return {k: to_dict(v) for k, v in obj.items()}
+    return obj
+
+
+def _convert(hint: Any, value: Any) -> Any:
+    """Rebuild value according to a resolved type hint."""
+    if value is None:
+        return None
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        return from_dict(hint, value)
+    origin = typing.get_origin(hint)
+    if origin is Union or origin is types.UnionType:
+        # Optional[X] -- the only unions the protocols use
+        args = [a for a in typing.get_args(hint) if a is not type(None)]
+        return _convert(args[0], value) if len(args) == 1 else value
+    if origin is tuple:
+        args = typing.get_args(hint)
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(_convert(args[0], v) for v in value)
+        if args:
+            return tuple(_convert(a, v) for a, v in zip(args, value))
+        return tuple(value)
+    return value
+
+
+def from_dict(cls: type, data: dict[str, Any]) -> Any:
+    """
+    Construct dataclass cls from a to_dict() payload. Missing keys fall
+    back to field defaults; unknown keys are ignored.
+    """
+    kwargs = {
+        name: _convert(hint, data[name])
+        for name, hint in _field_plan(cls)
+        if name in data
+    }
+    return cls(**kwargs)
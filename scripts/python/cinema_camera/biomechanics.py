@@ -9,14 +9,19 @@ moment arm and dramatically increasing rotational inertia.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
 
 from .protocols import CameraState, LensState
 
 
-@dataclass(frozen=True)
-class BiomechanicsParams:
-    """CHOPs solver parameters derived from physical rig properties."""
+class BiomechanicsParams(NamedTuple):
+    """
+    CHOPs solver parameters derived from physical rig properties.
+    A NamedTuple: cheap to build per frame, unpacks positionally and
+    converts straight to an ndarray.
+    """
     # Spring solver
     spring_constant: float      # Higher = snappier response
     damping_ratio: float        # 0-1: 0=undamped, 1=critically damped
@@ -50,6 +55,8 @@ def derive_biomechanics(
     """
     lens_weight = lens_state.rig_weight_kg
     combined_weight = body_weight_kg + lens_weight
+    if combined_weight <= 0:
+        raise ValueError(f"Invalid combined rig weight: {combined_weight}kg")
 
     # Moment arm: distance from tripod pivot to center of mass
     # Approximate: sensor offset + half lens length
@@ -87,6 +94,40 @@ def derive_biomechanics(
     )
 
 
+def derive_biomechanics_batch(
+    combined_weight_kg,
+    moment_arm_cm,
+    fluid_head_damping_base: float = 0.6,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized derive_biomechanics() over arrays of rig weights and
+    moment arms (e.g. a CHOPs parameter sweep across a shot).
+
+    Takes the already-combined body + lens weight and the pivot-to-CoM
+    moment arm, broadcast against each other. Returns one float64 array
+    per BiomechanicsParams field, keyed by field name. Same curves and
+    validation as the scalar path -- keep the two in sync.
+
+    Raises ValueError if any combined weight is not positive.
+    """
+    w = np.asarray(combined_weight_kg, dtype=np.float64)
+    arm = np.asarray(moment_arm_cm, dtype=np.float64)
+    w, arm = np.broadcast_arrays(w, arm)
+    if np.any(w <= 0):
+        raise ValueError(
+            f"Invalid combined rig weight: {w[w <= 0].min()}kg (must be > 0)"
+        )
+    return {
+        "spring_constant": np.maximum(5.0, 25.0 - w * 1.3),
+        "damping_ratio": np.minimum(0.95, fluid_head_damping_base + w * 0.025),
+        "lag_frames": w * 0.3,
+        "handheld_amplitude_deg": np.maximum(0.05, 1.5 / w),
+        "handheld_frequency_hz": np.maximum(2.0, 8.0 - w * 0.3),
+        "moment_of_inertia": w * arm ** 2,
+        "combined_weight_kg": w.copy(),
+    }
+
+
 def derive_biomechanics_calibrated(
     camera_state: CameraState,
     lens_state: LensState,
@@ -117,6 +158,8 @@ def derive_biomechanics_calibrated(
 
     lens_weight = lens_state.rig_weight_kg
     combined_weight = body_weight_kg + lens_weight
+    if combined_weight <= 0:
+        raise ValueError(f"Invalid combined rig weight: {combined_weight}kg")
 
     lens_half_length_cm = 0.0
     if lens_state.spec.has_mechanics:
@@ -9,6 +9,8 @@ Body Weight: 3.9 kg (body only, no lens or viewfinder)
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from ..protocols import CameraState, SensorSpec, FormatSpec
 from ..registry import register_body
 
@@ -34,12 +36,16 @@ ALEXA35_FORMATS = {
 BODY_WEIGHT_KG = 3.9
 
 
+@lru_cache(maxsize=64)
 def create_alexa35(
     format_name: str = "4.6K 3:2 Open Gate",
     exposure_index: int = 800,
     shutter_angle_deg: float = 180.0,
 ) -> CameraState:
-    """Factory: create an ARRI ALEXA 35 camera state."""
+    """
+    Factory: create an ARRI ALEXA 35 camera state.
+    Memoized -- CameraState is frozen, so equal arguments share one instance.
+    """
     fmt = ALEXA35_FORMATS.get(format_name)
     if fmt is None:
         raise ValueError(
@@ -5,18 +5,31 @@ Executed through the Synapse bridge in live Houdini sessions.
 Each builder creates one HDA and saves it to disk.
 """
 
-from .build_camera_rig_lop import build_camera_rig_lop_hda
-from .build_chops_biomechanics import build_chops_biomechanics_hda
-from .build_cop_anamorphic_flare import build_cop_anamorphic_flare_hda
-from .build_cop_sensor_noise import build_cop_sensor_noise_hda
-from .build_cop_stmap_aov import build_cop_stmap_aov_hda
-from .parm_templates import build_camera_rig_parm_templates
-
-__all__ = [
-    "build_camera_rig_lop_hda",
-    "build_camera_rig_parm_templates",
-    "build_chops_biomechanics_hda",
-    "build_cop_anamorphic_flare_hda",
-    "build_cop_sensor_noise_hda",
-    "build_cop_stmap_aov_hda",
-]
+import importlib
+
+# Public name -> (submodule, attribute). Builders are imported on first
+# access (PEP 562) so using one does not pay for importing the others.
+_LAZY = {
+    "build_camera_rig_lop_hda":        ("build_camera_rig_lop", "build_camera_rig_lop_hda"),
+    "build_camera_rig_parm_templates": ("parm_templates", "build_camera_rig_parm_templates"),
+    "build_chops_biomechanics_hda":    ("build_chops_biomechanics", "build_chops_biomechanics_hda"),
+    "build_cop_anamorphic_flare_hda":  ("build_cop_anamorphic_flare", "build_cop_anamorphic_flare_hda"),
+    "build_cop_sensor_noise_hda":      ("build_cop_sensor_noise", "build_cop_sensor_noise_hda"),
+    "build_cop_stmap_aov_hda":         ("build_cop_stmap_aov", "build_cop_stmap_aov_hda"),
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        modname, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{modname}", __name__), attr)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
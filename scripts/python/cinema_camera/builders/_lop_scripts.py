@@ -0,0 +1,286 @@
+"""
+Cinema Camera Rig v4.0 -- LOP HDA Cook Scripts
+
+Cook steps of the single Python Script LOP inside
+cinema::camera_rig_lop::1.0. Each step is compiled to a code object
+once, at import; the HDA's python parm only holds a one-line stub
+calling run_camera_rig(), so cooks skip lexing, parsing and bytecode
+generation.
+
+Steps run in order with shared globals. Bound once at import
+(_GLOBALS): the pxr modules (`Gf`, `Sdf`, `Usd`, `UsdGeom`, `UsdRender`,
+`UsdShade`, `Vt`), `rig_optics`, `BODY_OFFSETS_CM` /
+`DEFAULT_BODY_OFFSET_CM`, `author_specs` (batched custom-attribute
+authoring) and `rig_template` (the rig hierarchy as a string.Template
+of .usda text). Set per cook: `hou`, `node` (the Python Script LOP),
+`hda` (its parent HDA), `stage` (a scratch stage whose authored prims
+are merged into the LOP's editable stage at the end), `vals` (HDA parm
+values, read in one batch), `rig_path` and `camera_path`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from importlib.resources import files
+from string import Template
+
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdRender, UsdShade, Vt
+
+from .._fastoptics import rig_optics
+
+
+# ════════════════════════════════════════════════════════════
+# HDA PARAMETERS READ BY THE COOK
+# ════════════════════════════════════════════════════════════
+
+_CAMERA_RIG_PARMS = (
+    "usd_camera_path", "body_id", "write_cooke_i", "write_aswf_exr",
+    "focal_length_mm", "t_stop", "focus_distance_m",
+    "sensor_width_mm", "sensor_height_mm", "resolution_x", "resolution_y",
+    "squeeze_ratio", "effective_squeeze", "entrance_pupil_offset_mm",
+    "exposure_index", "combined_weight_kg",
+    "dist_k1", "dist_k2", "dist_k3", "dist_p1", "dist_p2", "dist_sq_uniformity",
+)
+
+
+# Camera body -> (y, z) offset in cm of the Body Xform from the fluid
+# head. Built once per process; keys interned for identity-fast lookup.
+BODY_OFFSETS_CM = {
+    sys.intern("alexa35"):      (5.0, -8.0),
+    sys.intern("red_komodo"):   (3.5, -5.0),
+    sys.intern("sony_venice2"): (5.5, -9.0),
+}
+DEFAULT_BODY_OFFSET_CM = (4.0, -7.0)
+
+
+# ════════════════════════════════════════════════════════════
+# SCRIPT BODIES
+# ════════════════════════════════════════════════════════════
+
+# Bodies live as plain column-0 files in _lop_src/ (no dedent at
+# import); compiling with the real path gives tracebacks file + line.
+_SRC = files("cinema_camera.builders._lop_src")
+
+
+def _compile(filename: str):
+    src = _SRC.joinpath(filename)
+    return compile(src.read_text(encoding="utf-8"), str(src), "exec")
+
+
+BUILD_RIG_CODE = _compile("build_rig.py")
+LENS_SHADER_CODE = _compile("lens_shader.py")
+RENDER_PRODUCT_CODE = _compile("render_product.py")
+RENDER_SETTINGS_CODE = _compile("render_settings.py")
+
+# Rig hierarchy as .usda text with $placeholders, read once at import
+RIG_TEMPLATE = Template(
+    _SRC.joinpath("camera_rig.usda").read_text(encoding="utf-8")
+)
+
+# Digest of the step sources and the rig template. Part of the cook
+# memo key, so a cook memoized by older code is never replayed.
+COOK_VERSION = hashlib.sha1(b"\0".join(
+    _SRC.joinpath(name).read_bytes() for name in (
+        "build_rig.py", "lens_shader.py", "render_product.py",
+        "render_settings.py", "camera_rig.usda",
+    )
+)).hexdigest()
+
+# Cook order: rig -> lens shader -> RenderProduct -> RenderSettings
+CAMERA_RIG_STEPS = (
+    BUILD_RIG_CODE, LENS_SHADER_CODE, RENDER_PRODUCT_CODE, RENDER_SETTINGS_CODE,
+)
+# Same, without the RenderProduct when no EXR metadata is requested
+CAMERA_RIG_STEPS_NO_PRODUCT = (
+    BUILD_RIG_CODE, LENS_SHADER_CODE, RENDER_SETTINGS_CODE,
+)
+
+
+# ════════════════════════════════════════════════════════════
+# COOK ENTRY POINT (called from the Python Script LOP stub)
+# ════════════════════════════════════════════════════════════
+
+def _author_specs(stage, path: str, rows) -> None:
+    """
+    Author custom attributes from (name, sdf_type, value) rows on the
+    prim at path. Writes Sdf attribute specs straight into the edit
+    target layer inside one Sdf.ChangeBlock, so the whole burst costs a
+    single change notification. The prim must already be defined.
+    """
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
+    with Sdf.ChangeBlock():
+        prim_spec = Sdf.CreatePrimInLayer(
+            layer, edit_target.MapToSpecPath(Sdf.Path(path))
+        )
+        attributes = prim_spec.attributes
+        for attr_name, sdf_type, value in rows:
+            attr_spec = attributes.get(attr_name)
+            if attr_spec is None:
+                attr_spec = Sdf.AttributeSpec(
+                    prim_spec, attr_name, sdf_type, declaresCustom=True
+                )
+            attr_spec.default = value
+
+
+def _eval_parms(hda, key: str, names: tuple[str, ...]) -> dict:
+    """
+    Evaluate the named HDA parms in one pass. The resolved hou.Parm
+    objects are kept in the HDA's cached user data under key together
+    with names, so later cooks skip the per-name parm() lookups; a
+    different names tuple re-resolves instead of pairing stale refs.
+    """
+    import hou
+
+    cached = hda.cachedUserData(key)
+    if cached is not None and cached[0] == names:
+        try:
+            return {name: p.eval() for name, p in zip(names, cached[1])}
+        except hou.ObjectWasDeleted:
+            pass  # parm interface changed since the refs were cached
+    parms = tuple(hda.parm(name) for name in names)
+    hda.setCachedUserData(key, (names, parms))
+    return {name: p.eval() for name, p in zip(names, parms)}
+
+
+def _rig_paths(hda, usd_camera_path: str) -> tuple[str, str]:
+    """
+    (rig_path, camera_path) for a usd_camera_path parm value. Cached on
+    the HDA keyed by that value, so a changed parm simply misses.
+    """
+    cached = hda.cachedUserData("rig_paths")
+    if cached is not None and cached[0] == usd_camera_path:
+        return cached[1], cached[2]
+    rig_path = usd_camera_path
+    if not rig_path or rig_path == "/CinemaRig/Camera":
+        rig_path = "/CinemaRig"
+    camera_path = rig_path + "/FluidHead/Body/Sensor"
+    hda.setCachedUserData("rig_paths", (usd_camera_path, rig_path, camera_path))
+    return rig_path, camera_path
+
+
+def _input_key(hda) -> tuple:
+    """Identity of the HDA's upstream inputs: (session id, cook count)."""
+    return tuple(
+        None if n is None else (n.sessionId(), n.cookCount())
+        for n in hda.inputs()
+    )
+
+
+def _merge_prim(src, dst, path) -> None:
+    """
+    Merge the prim spec at path from layer src onto the existing spec in
+    dst: prim metadata and each property are copied over one by one and
+    children are merged recursively, so opinions dst already holds that
+    src does not author (upstream attributes, extra children) survive.
+    Subtrees absent from dst are copied whole.
+    """
+    src_spec = src.GetPrimAtPath(path)
+    dst_spec = dst.GetPrimAtPath(path)
+    if dst_spec is None:
+        Sdf.CopySpec(src, path, dst, path)
+        return
+    for key in src_spec.ListInfoKeys():
+        if key == "specifier":
+            if src_spec.specifier != Sdf.SpecifierOver:
+                dst_spec.specifier = src_spec.specifier
+        else:
+            dst_spec.SetInfo(key, src_spec.GetInfo(key))
+    for prop in src_spec.properties:
+        Sdf.CopySpec(src, prop.path, dst, prop.path)
+    for child in src_spec.nameChildren:
+        _merge_prim(src, dst, child.path)
+
+
+def _copy_prims(src, dst, paths) -> None:
+    """
+    Merge each prim subtree at paths from layer src into layer dst, in
+    one ChangeBlock (see _merge_prim). Ancestors missing from dst are
+    created and take the source specifier, so defs stay defs. Absent
+    paths are skipped.
+    """
+    with Sdf.ChangeBlock():
+        for path in paths:
+            path = Sdf.Path(path)
+            if src.GetPrimAtPath(path) is None:
+                continue
+            for prefix in path.GetParentPath().GetPrefixes():
+                dst_spec = Sdf.CreatePrimInLayer(dst, prefix)
+                if dst_spec.specifier == Sdf.SpecifierOver:
+                    dst_spec.specifier = src.GetPrimAtPath(prefix).specifier
+            _merge_prim(src, dst, path)
+
+
+def clear_cook_caches(hda) -> None:
+    """
+    Drop everything run_camera_rig keeps in hda's cached user data
+    (parm refs, resolved paths, memoized cook). Called on HDA reinstall.
+    """
+    for key in ("cinema_parms", "rig_paths", "last_cook"):
+        hda.destroyCachedUserData(key)
+
+
+# Step globals that never change between cooks: modules and tables are
+# bound once here, so step bodies carry no import statements.
+_GLOBALS = {
+    "Gf": Gf, "Sdf": Sdf, "Usd": Usd, "UsdGeom": UsdGeom,
+    "UsdRender": UsdRender, "UsdShade": UsdShade, "Vt": Vt,
+    "rig_optics": rig_optics,
+    "BODY_OFFSETS_CM": BODY_OFFSETS_CM,
+    "DEFAULT_BODY_OFFSET_CM": DEFAULT_BODY_OFFSET_CM,
+    "author_specs": _author_specs, "rig_template": RIG_TEMPLATE,
+}
+
+
+def run_camera_rig(node) -> None:
+    """
+    Cook the whole rig in one Python Script LOP: author the USD
+    hierarchy, bind the lens shader, then define the RenderProduct and
+    RenderSettings. Steps share one globals dict, so parm values, the
+    authoring stage and the resolved paths are fetched once per cook.
+
+    Steps author into a scratch stage over an anonymous layer, so no
+    change notices reach the LOP's stage until the authored prims are
+    copied over in one ChangeBlock. An unchanged cook copies the
+    previous cook's layer instead of running the steps.
+    """
+    import hou
+
+    hda = node.parent()
+    vals = _eval_parms(hda, "cinema_parms", _CAMERA_RIG_PARMS)
+    rig_path, camera_path = _rig_paths(hda, vals["usd_camera_path"])
+    layer = node.editableStage().GetEditTarget().GetLayer()
+
+    # Memoized cook: same step code, parm values and upstream inputs as
+    # last time means the same specs. The active layer may hold upstream content,
+    # so authored prims are merged per root rather than replacing the
+    # whole layer (TransferContent / ImportFromString).
+    key = (COOK_VERSION, tuple(vals.values()), _input_key(hda))
+    cached = hda.cachedUserData("last_cook")
+    if cached is not None and cached[0] == key:
+        _copy_prims(cached[1], layer, cached[2])
+        return
+
+    scratch = Sdf.Layer.CreateAnonymous("cinema_rig_cook")
+    shared = dict(_GLOBALS)
+    shared.update(
+        hou=hou, node=node, hda=hda,
+        stage=Usd.Stage.Open(scratch), vals=vals,
+        rig_path=rig_path, camera_path=camera_path,
+    )
+    if vals["write_cooke_i"] or vals["write_aswf_exr"]:
+        steps = CAMERA_RIG_STEPS
+    else:
+        steps = CAMERA_RIG_STEPS_NO_PRODUCT
+    for code in steps:
+        exec(code, shared)
+
+    # Prim roots the steps author (see render_product / render_settings)
+    roots = (
+        rig_path,
+        "/Render/Products/" + camera_path.rsplit("/", 1)[-1],
+        "/Render/CinemaRigSettings",
+    )
+    _copy_prims(scratch, layer, roots)
+    hda.setCachedUserData("last_cook", (key, scratch, roots))
@@ -0,0 +1,5 @@
+"""
+Cook-script sources for the cinema::camera_rig_lop::1.0 Python Script
+LOPs. Loaded as resources and compiled by builders._lop_scripts; not
+meant to be imported.
+"""
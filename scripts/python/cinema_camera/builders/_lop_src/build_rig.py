@@ -0,0 +1,93 @@
+"""
+Step: Author USD camera rig hierarchy
+Reads HDA-level parms and authors the rig with pure pxr calls
+
+Cook step of cinema::camera_rig_lop::1.0, compiled by _lop_scripts.
+All steps run in order in one Python Script LOP, sharing the globals
+listed in _lop_scripts (pxr modules included, so no imports here).
+"""
+
+# ── HDA parameters (batch-read into vals) ────────────
+focal_length_mm = vals["focal_length_mm"]
+t_stop = vals["t_stop"]
+focus_distance_m = vals["focus_distance_m"]
+sensor_width_mm = vals["sensor_width_mm"]
+sensor_height_mm = vals["sensor_height_mm"]
+resolution_x = vals["resolution_x"]
+resolution_y = vals["resolution_y"]
+squeeze_ratio = vals["squeeze_ratio"]
+effective_squeeze = vals["effective_squeeze"]
+entrance_pupil_offset_mm = vals["entrance_pupil_offset_mm"]
+body_id = vals["body_id"]
+exposure_index = vals["exposure_index"]
+
+# Distortion
+dist_k1 = vals["dist_k1"]
+dist_k2 = vals["dist_k2"]
+dist_k3 = vals["dist_k3"]
+dist_p1 = vals["dist_p1"]
+dist_p2 = vals["dist_p2"]
+dist_sq_uniformity = vals["dist_sq_uniformity"]
+
+# Biomechanics (weight for metadata)
+combined_weight_kg = vals["combined_weight_kg"]
+
+# ── Body offset lookup (table lives in _lop_scripts) ─
+body_offset_y_cm, body_offset_z_cm = BODY_OFFSETS_CM.get(
+    body_id, DEFAULT_BODY_OFFSET_CM,
+)
+
+# Optics: FOV, DOF and hyperfocal in one compiled call
+hfov_deg, vfov_deg, dof_near_m, dof_far_m, hyperfocal_m, coc_mm = rig_optics(
+    focal_length_mm, t_stop, focus_distance_m, sensor_width_mm, sensor_height_mm,
+)
+
+# ── Build Xform hierarchy ────────────────────────────
+# /RigRoot/FluidHead/Body/Sensor/EntrancePupil with its xform ops,
+# camera and cinema:* attributes comes from camera_rig.usda:
+# substitute this cook's values, parse the text in one pass into an
+# anonymous layer, then CopySpec the tree to rig_path. The parse replaces
+# dozens of Python-side Sdf calls; the copy (not ImportFromString on the
+# edit target) leaves upstream content in the active layer alone.
+entrance_pupil_offset_cm = entrance_pupil_offset_mm / 10.0
+
+rig_text = rig_template.substitute({
+    "body_offset_y_cm": repr(body_offset_y_cm),
+    "body_offset_z_cm": repr(body_offset_z_cm),
+    "focal_length_mm": repr(float(focal_length_mm)),
+    "t_stop": repr(float(t_stop)),
+    "focus_distance_m": repr(float(focus_distance_m)),
+    "focus_distance_cm": repr(float(focus_distance_m * 100.0)),
+    "sensor_width_mm": repr(float(sensor_width_mm)),
+    "sensor_height_mm": repr(float(sensor_height_mm)),
+    "squeeze_ratio": repr(float(squeeze_ratio)),
+    "effective_squeeze": repr(float(effective_squeeze)),
+    "entrance_pupil_offset_cm": repr(float(entrance_pupil_offset_cm)),
+    "combined_weight_kg": repr(float(combined_weight_kg)),
+    "dist_k1": repr(float(dist_k1)),
+    "dist_k2": repr(float(dist_k2)),
+    "dist_k3": repr(float(dist_k3)),
+    "dist_p1": repr(float(dist_p1)),
+    "dist_p2": repr(float(dist_p2)),
+    "dist_sq_uniformity": repr(float(dist_sq_uniformity)),
+    "hfov_deg": repr(hfov_deg),
+    "vfov_deg": repr(vfov_deg),
+    "dof_near_m": repr(dof_near_m),
+    "dof_far_m": repr(dof_far_m),
+    "hyperfocal_m": repr(hyperfocal_m),
+    "coc_mm": repr(coc_mm),
+    "exposure_index": int(exposure_index),
+    "resolution_x": int(resolution_x),
+    "resolution_y": int(resolution_y),
+})
+rig_layer = Sdf.Layer.CreateAnonymous("cinema_rig.usda")
+rig_layer.ImportFromString(rig_text)
+
+layer = stage.GetEditTarget().GetLayer()
+with Sdf.ChangeBlock():
+    # Like Usd.Stage.DefinePrim: ancestors become untyped defs
+    for prefix in Sdf.Path(rig_path).GetParentPath().GetPrefixes():
+        spec = Sdf.CreatePrimInLayer(layer, prefix)
+        if spec.specifier == Sdf.SpecifierOver:
+            spec.specifier = Sdf.SpecifierDef
+    Sdf.CopySpec(rig_layer, "/CinemaRig", layer, rig_path)
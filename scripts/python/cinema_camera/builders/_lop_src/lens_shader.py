@@ -0,0 +1,37 @@
+"""
+Step: Bind Karma CVEX lens shader
+
+Cook step of cinema::camera_rig_lop::1.0, compiled by _lop_scripts.
+All steps run in order in one Python Script LOP, sharing the globals
+listed in _lop_scripts (pxr modules included, so no imports here).
+"""
+
+shader_path = camera_path + "/CinemaLensShader"
+
+shader = UsdShade.Shader.Define(stage, shader_path)
+shader.CreateIdAttr("karma:cvex:cinema_lens_shader")
+
+# Lens + distortion state as one float[] input, in
+# karma_lens_shader.LENS_COEFFS_LAYOUT order (LC_* in the CVEX source)
+shader.CreateInput("lens_coeffs", Sdf.ValueTypeNames.FloatArray).Set(
+    Vt.FloatArray((
+        vals["focal_length_mm"],
+        vals["effective_squeeze"],
+        vals["entrance_pupil_offset_mm"] / 10.0,
+        vals["sensor_width_mm"],
+        vals["sensor_height_mm"],
+        vals["dist_k1"],
+        vals["dist_k2"],
+        vals["dist_k3"],
+        vals["dist_p1"],
+        vals["dist_p2"],
+        vals["dist_sq_uniformity"],
+    ))
+)
+
+# Bind shader to camera prim
+camera_prim = stage.GetPrimAtPath(camera_path)
+if camera_prim:
+    camera_prim.CreateAttribute(
+        "karma:lens:shader", Sdf.ValueTypeNames.String
+    ).Set(shader_path)
@@ -0,0 +1,81 @@
+"""
+Step: Configure RenderProduct with Cooke /i metadata
+
+Cook step of cinema::camera_rig_lop::1.0, compiled by _lop_scripts.
+All steps run in order in one Python Script LOP, sharing the globals
+listed in _lop_scripts (pxr modules included, so no imports here).
+"""
+
+# Value type names resolved once per cook
+_F = Sdf.ValueTypeNames.Float
+_I = Sdf.ValueTypeNames.Int
+
+# Only run when write_cooke_i or write_aswf_exr is on; run_camera_rig
+# skips this step entirely otherwise.
+resolution_x = vals["resolution_x"]
+resolution_y = vals["resolution_y"]
+
+cam_name = camera_path.split("/")[-1]
+product_path = "/Render/Products/" + cam_name
+
+# RenderProduct as raw Sdf specs: same layer content as
+# UsdRender.Product.Define + Create*Attr, without schema dispatch
+layer = stage.GetEditTarget().GetLayer()
+with Sdf.ChangeBlock():
+    product = Sdf.CreatePrimInLayer(layer, product_path)
+    parent = product.nameParent
+    while parent and parent.path != Sdf.Path.absoluteRootPath:
+        if parent.specifier == Sdf.SpecifierOver:
+            parent.specifier = Sdf.SpecifierDef
+        parent = parent.nameParent
+    product.specifier = Sdf.SpecifierDef
+    product.typeName = "RenderProduct"
+
+    Sdf.AttributeSpec(
+        product, "resolution", Sdf.ValueTypeNames.Int2, Sdf.VariabilityUniform,
+    ).default = Gf.Vec2i(resolution_x, resolution_y)
+    Sdf.AttributeSpec(
+        product, "pixelAspectRatio", _F, Sdf.VariabilityUniform,
+    ).default = 1.0
+    Sdf.RelationshipSpec(product, "camera", False).targetPathList.explicitItems = [
+        Sdf.Path(camera_path),
+    ]
+    Sdf.AttributeSpec(
+        product, "productName", Sdf.ValueTypeNames.Token,
+    ).default = "cinema_rig_render.exr"
+
+author_specs(stage, product_path, [
+    # Camera identification
+    ("driver:parameters:OpenEXR:camera:sensorWidthMm",
+     _F, vals["sensor_width_mm"]),
+    ("driver:parameters:OpenEXR:camera:sensorHeightMm",
+     _F, vals["sensor_height_mm"]),
+    ("driver:parameters:OpenEXR:camera:exposureIndex",
+     _I, vals["exposure_index"]),
+
+    # Lens identification (Cooke /i format)
+    ("driver:parameters:OpenEXR:lens:focalLengthMm",
+     _F, vals["focal_length_mm"]),
+    ("driver:parameters:OpenEXR:lens:tStop",
+     _F, vals["t_stop"]),
+    ("driver:parameters:OpenEXR:lens:focusDistanceM",
+     _F, vals["focus_distance_m"]),
+    ("driver:parameters:OpenEXR:lens:squeezeRatio",
+     _F, vals["effective_squeeze"]),
+
+    # Distortion model
+    ("driver:parameters:OpenEXR:lens:distortion:k1",
+     _F, vals["dist_k1"]),
+    ("driver:parameters:OpenEXR:lens:distortion:k2",
+     _F, vals["dist_k2"]),
+    ("driver:parameters:OpenEXR:lens:distortion:k3",
+     _F, vals["dist_k3"]),
+    ("driver:parameters:OpenEXR:lens:distortion:p1",
+     _F, vals["dist_p1"]),
+    ("driver:parameters:OpenEXR:lens:distortion:p2",
+     _F, vals["dist_p2"]),
+
+    # Mechanical metadata
+    ("driver:parameters:OpenEXR:lens:entrancePupilOffsetMm",
+     _F, vals["entrance_pupil_offset_mm"]),
+])
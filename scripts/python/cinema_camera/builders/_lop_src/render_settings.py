@@ -0,0 +1,39 @@
+"""
+Step: Configure Karma XPU render settings
+
+Cook step of cinema::camera_rig_lop::1.0, compiled by _lop_scripts.
+All steps run in order in one Python Script LOP, sharing the globals
+listed in _lop_scripts (pxr modules included, so no imports here).
+"""
+
+resolution_x = vals["resolution_x"]
+resolution_y = vals["resolution_y"]
+
+settings_path = "/Render/CinemaRigSettings"
+cam_name = camera_path.split("/")[-1]
+product_path = "/Render/Products/" + cam_name
+
+# RenderSettings as raw Sdf specs: same layer content as
+# UsdRender.Settings.Define + Create*Attr, without schema dispatch
+layer = stage.GetEditTarget().GetLayer()
+with Sdf.ChangeBlock():
+    settings = Sdf.CreatePrimInLayer(layer, settings_path)
+    parent = settings.nameParent
+    if parent.specifier == Sdf.SpecifierOver:
+        parent.specifier = Sdf.SpecifierDef
+    settings.specifier = Sdf.SpecifierDef
+    settings.typeName = "RenderSettings"
+
+    Sdf.AttributeSpec(
+        settings, "resolution", Sdf.ValueTypeNames.Int2, Sdf.VariabilityUniform,
+    ).default = Gf.Vec2i(resolution_x, resolution_y)
+
+    # Point to the cinema camera as the render camera
+    Sdf.AttributeSpec(
+        settings, "camera", Sdf.ValueTypeNames.String, declaresCustom=True,
+    ).default = camera_path
+
+    # Link to render product
+    Sdf.RelationshipSpec(settings, "products", False).targetPathList.explicitItems = [
+        Sdf.Path(product_path),
+    ]
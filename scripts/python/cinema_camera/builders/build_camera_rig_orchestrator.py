@@ -14,6 +14,11 @@ from __future__ import annotations
 
 import os
 
+try:
+    import hou
+except ImportError:  # pragma: no cover - outside Houdini
+    hou = None
+
 from .parm_templates import build_camera_rig_parm_templates
 
 
@@ -32,8 +37,6 @@ def build_camera_rig_orchestrator_hda(
 
     Returns: Absolute path to saved .hda file.
     """
-    import hou
-
     if save_dir is None:
         save_dir = os.path.join(os.environ["CINEMA_CAMERA_PATH"], "hda")
 
@@ -9,11 +9,47 @@ Pillar D: Shader parameter binding layer.
 
 from __future__ import annotations
 
-from pxr import Sdf, Usd, UsdShade
+from pxr import Sdf, Usd, UsdShade, Vt
 
 from .protocols import CameraState, LensState
 
 
+# Index order of the shader's single float[] input "lens_coeffs";
+# mirrored by the LC_* defines in vex/include/karma_cinema_lens.vfl.
+LENS_COEFFS_LAYOUT = (
+    "focal_length_mm",
+    "effective_squeeze",
+    "entrance_pupil_offset_cm",
+    "sensor_width_mm",
+    "sensor_height_mm",
+    # Distortion coefficients, in DISTORTION_COEFFS_LAYOUT order
+    "dist_k1",
+    "dist_k2",
+    "dist_k3",
+    "dist_p1",
+    "dist_p2",
+    "dist_sq_uniformity",
+)
+
+
+def _lens_coeffs(
+    camera_state: CameraState,
+    lens_state: LensState,
+) -> tuple[float, ...]:
+    """
+    lens_coeffs values for the CVEX lens shader, in LENS_COEFFS_LAYOUT
+    order.
+    """
+    spec = lens_state.spec
+    return (
+        spec.focal_length_mm,
+        lens_state.effective_squeeze,
+        lens_state.entrance_pupil_offset_cm,
+        camera_state.active_width_mm,
+        camera_state.active_height_mm,
+    ) + spec.distortion.coeffs
+
+
 def bind_lens_shader(
     stage: Usd.Stage,
     camera_path: str,
@@ -34,32 +70,9 @@ def bind_lens_shader(
     # Shader ID for Karma CVEX
     shader.CreateIdAttr("karma:cvex:cinema_lens_shader")
 
-    # ── Bind lens parameters ─────────────────────────────
-    shader.CreateInput("focal_length_mm", Sdf.ValueTypeNames.Float).Set(
-        lens_state.spec.focal_length_mm
-    )
-    shader.CreateInput("effective_squeeze", Sdf.ValueTypeNames.Float).Set(
-        lens_state.effective_squeeze
-    )
-    shader.CreateInput("entrance_pupil_offset_cm", Sdf.ValueTypeNames.Float).Set(
-        lens_state.entrance_pupil_offset_cm
-    )
-    shader.CreateInput("sensor_width_mm", Sdf.ValueTypeNames.Float).Set(
-        camera_state.active_width_mm
-    )
-    shader.CreateInput("sensor_height_mm", Sdf.ValueTypeNames.Float).Set(
-        camera_state.active_height_mm
-    )
-
-    # Distortion coefficients
-    d = lens_state.spec.distortion
-    shader.CreateInput("dist_k1", Sdf.ValueTypeNames.Float).Set(d.k1)
-    shader.CreateInput("dist_k2", Sdf.ValueTypeNames.Float).Set(d.k2)
-    shader.CreateInput("dist_k3", Sdf.ValueTypeNames.Float).Set(d.k3)
-    shader.CreateInput("dist_p1", Sdf.ValueTypeNames.Float).Set(d.p1)
-    shader.CreateInput("dist_p2", Sdf.ValueTypeNames.Float).Set(d.p2)
-    shader.CreateInput("dist_sq_uniformity", Sdf.ValueTypeNames.Float).Set(
-        d.squeeze_uniformity
+    # ── Bind lens parameters (one float[] input) ─────────
+    shader.CreateInput("lens_coeffs", Sdf.ValueTypeNames.FloatArray).Set(
+        Vt.FloatArray(_lens_coeffs(camera_state, lens_state))
     )
 
     # ── Bind shader to camera ────────────────────────────
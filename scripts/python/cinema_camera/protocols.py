@@ -5,22 +5,39 @@ Typed data contracts for the entire camera rig pipeline.
 v3.0 foundation types + v4.0 mechanical/dynamic extensions.
 
 All dataclasses are frozen (immutable after creation) for thread safety
-and to enforce the data-flows-forward architecture.
+and to enforce the data-flows-forward architecture. They are also
+slotted; LensSpec fills its USD attribute cache slot on first use.
+Identifier strings (models, lens ids, series, ...)
+are interned on construction so the many equal copies share storage and
+compare by identity.
 """
 
 from __future__ import annotations
 
+import bisect
 import math
-from dataclasses import dataclass, field
+import sys
+import weakref
+from dataclasses import dataclass, field, fields
 from typing import Any, Optional
 
+import numpy as np
+
+from ._fastcurve import HAVE_NUMBA, eval_curve
+
 
 # ════════════════════════════════════════════════════════════
 # v3.0 FOUNDATION TYPES
 # ════════════════════════════════════════════════════════════
 
+# Index order of the packed cinema:lens:distortionCoeffs camera attribute
+# (authored by usd_builder and the LOP camera_rig.usda template). Names
+# match the scalar cinema:lens:distortion:<name> attributes, and the
+# order matches the dist_* tail of karma_lens_shader.LENS_COEFFS_LAYOUT.
+DISTORTION_COEFFS_LAYOUT = ("k1", "k2", "k3", "p1", "p2", "sqUniformity")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class DistortionModel:
     """Brown-Conrady distortion coefficients + anamorphic squeeze uniformity."""
     k1: float = 0.0          # Radial distortion (barrel/pincushion)
@@ -36,8 +53,40 @@ class DistortionModel:
                 f"squeeze_uniformity must be 0.8-1.0, got {self.squeeze_uniformity}"
             )
 
+    @property
+    def coeffs(self) -> tuple[float, ...]:
+        """Coefficients in DISTORTION_COEFFS_LAYOUT order."""
+        return (self.k1, self.k2, self.k3, self.p1, self.p2,
+                self.squeeze_uniformity)
+
 
-@dataclass(frozen=True)
+def _lerp_hinted(
+    xs: tuple[float, ...], ys: tuple[float, ...], d: float,
+    hint: list[int] | None = None,
+) -> float:
+    """
+    Scalar piecewise-linear lookup of d in sorted knots (xs, ys), clamped
+    to the end values. A caller-owned hint list ([0] to start) caches the
+    last interval index so that temporally coherent queries (animation
+    playback) skip the bisect.
+    """
+    if d <= xs[0]:
+        return ys[0]
+    if d >= xs[-1]:
+        return ys[-1]
+    if hint is None:
+        i = bisect.bisect_left(xs, d) - 1
+    else:
+        i = hint[0]
+        if not (xs[i] < d <= xs[i + 1]):
+            i = bisect.bisect_left(xs, d) - 1
+            hint[0] = i
+    x0 = xs[i]
+    t = (d - x0) / (xs[i + 1] - x0)
+    return ys[i] + t * (ys[i + 1] - ys[i])
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class BreathingCurve:
     """
     Focus-dependent FOV shift (breathing).
@@ -46,30 +95,44 @@ class BreathingCurve:
     At infinity focus, shift is 0%. At close focus, shift is positive (wider FOV).
     """
     points: tuple[tuple[float, float], ...] = ()
+    # SoA knots (scalar path) and a (2, N) float64 buffer for np.interp
+    # (batched path), both derived from points
+    _xs: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _ys: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _buf: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.points:
             sorted_pts = tuple(sorted(self.points, key=lambda p: p[0]))
             object.__setattr__(self, 'points', sorted_pts)
+        xs = tuple(p[0] for p in self.points)
+        ys = tuple(p[1] for p in self.points)
+        object.__setattr__(self, '_xs', xs)
+        object.__setattr__(self, '_ys', ys)
+        buf = np.array((xs, ys), dtype=np.float64).reshape(2, len(xs))
+        buf.flags.writeable = False
+        object.__setattr__(self, '_buf', buf)
+
+    def evaluate(
+        self, focus_distance_m: float | np.ndarray, hint: list[int] | None = None,
+    ) -> float | np.ndarray:
+        """
+        Linear interpolation of FOV shift at given focus distance.
+        Accepts a scalar (returns float) or an ndarray of distances.
+        Scalar playback loops may pass their own hint list (see
+        _lerp_hinted); curves are shared between lens specs, so the
+        hint is never stored on the curve.
+        """
+        if np.isscalar(focus_distance_m):
+            if not self._xs:
+                return 0.0
+            return _lerp_hinted(self._xs, self._ys, focus_distance_m, hint)
+        if not self._xs:
+            return np.zeros(np.shape(focus_distance_m))
+        return np.interp(focus_distance_m, self._buf[0], self._buf[1])
+
 
-    def evaluate(self, focus_distance_m: float) -> float:
-        """Linear interpolation of FOV shift at given focus distance."""
-        if not self.points:
-            return 0.0
-        if focus_distance_m <= self.points[0][0]:
-            return self.points[0][1]
-        if focus_distance_m >= self.points[-1][0]:
-            return self.points[-1][1]
-        for i in range(len(self.points) - 1):
-            f0, s0 = self.points[i]
-            f1, s1 = self.points[i + 1]
-            if f0 <= focus_distance_m <= f1:
-                t = (focus_distance_m - f0) / (f1 - f0) if f1 != f0 else 0
-                return s0 + t * (s1 - s0)
-        return 0.0
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SensorSpec:
     """Physical sensor specification."""
     width_mm: float
@@ -83,6 +146,7 @@ class SensorSpec:
             raise ValueError(
                 f"Invalid sensor dimensions: {self.width_mm}x{self.height_mm}mm"
             )
+        object.__setattr__(self, 'color_science', sys.intern(self.color_science))
 
     @property
     def diagonal_mm(self) -> float:
@@ -93,7 +157,7 @@ class SensorSpec:
         return self.width_mm / self.height_mm
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FormatSpec:
     """Recording format / resolution."""
     width_px: int
@@ -105,13 +169,14 @@ class FormatSpec:
             raise ValueError(
                 f"Invalid resolution: {self.width_px}x{self.height_px}"
             )
+        object.__setattr__(self, 'name', sys.intern(self.name))
 
     @property
     def aspect_ratio(self) -> float:
         return self.width_px / self.height_px
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CameraState:
     """
     Camera body state at a single frame.
@@ -129,6 +194,7 @@ class CameraState:
             raise ValueError(f"Invalid exposure index: {self.exposure_index}")
         if not (0 < self.shutter_angle_deg <= 360):
             raise ValueError(f"Invalid shutter angle: {self.shutter_angle_deg}")
+        object.__setattr__(self, 'model', sys.intern(self.model))
 
     @property
     def active_width_mm(self) -> float:
@@ -160,7 +226,7 @@ class CameraState:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpticalResult:
     """Computed optical parameters for a given camera+lens state."""
     hfov_deg: float
@@ -176,12 +242,17 @@ class OpticalResult:
 # ════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GearRingSpec:
     """Physical gear ring on a cinema lens barrel."""
     rotation_deg: float         # Total rotation travel
     gear_teeth: int             # Tooth count for follow-focus motors
     gear_module: float = 0.8   # Standard cine gear module (0.8mm pitch)
+    # Derived once in __post_init__
+    # PCD = module x teeth. Used for follow-focus motor compatibility.
+    pitch_circle_diameter_mm: float = field(init=False, repr=False, compare=False)
+    # Angular resolution of the gear ring.
+    degrees_per_tooth: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.rotation_deg <= 0 or self.rotation_deg > 360:
@@ -190,19 +261,15 @@ class GearRingSpec:
             raise ValueError(f"Invalid gear tooth count: {self.gear_teeth}")
         if self.gear_module <= 0:
             raise ValueError(f"Invalid gear module: {self.gear_module}")
+        object.__setattr__(
+            self, 'pitch_circle_diameter_mm', self.gear_module * self.gear_teeth
+        )
+        object.__setattr__(
+            self, 'degrees_per_tooth', self.rotation_deg / self.gear_teeth
+        )
 
-    @property
-    def pitch_circle_diameter_mm(self) -> float:
-        """PCD = module x teeth. Used for follow-focus motor compatibility."""
-        return self.gear_module * self.gear_teeth
 
-    @property
-    def degrees_per_tooth(self) -> float:
-        """Angular resolution of the gear ring."""
-        return self.rotation_deg / self.gear_teeth
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MechanicalSpec:
     """
     Physical dimensions and mechanics of a cinema lens.
@@ -229,6 +296,7 @@ class MechanicalSpec:
             raise ValueError(
                 f"Invalid entrance pupil offset: {self.entrance_pupil_offset_mm}mm"
             )
+        object.__setattr__(self, 'filter_thread', sys.intern(self.filter_thread))
 
     @property
     def weight_lbs(self) -> float:
@@ -240,7 +308,7 @@ class MechanicalSpec:
         return self.entrance_pupil_offset_mm / 10.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PupilShiftFit:
     """Wolfram-fitted entrance pupil position as function of focus distance."""
     coefficients: dict[str, float]  # {a0, a1, b1}
@@ -258,7 +326,7 @@ class PupilShiftFit:
         return (a0 + a1 * f) / denom
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SqueezeBreathingCurve:
     """
     Focus-dependent anamorphic squeeze variation ("Mumps").
@@ -274,10 +342,23 @@ class SqueezeBreathingCurve:
     """
     points: tuple[tuple[float, float], ...]  # ((focus_m, squeeze), ...)
     nominal_squeeze: float = 2.0
+    # SoA knots (scalar path) and one contiguous (2, N) float64 buffer,
+    # row 0 = focus_m, row 1 = squeeze (np.interp and compiled array
+    # paths), all derived from points
+    _xs: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _ys: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _buf: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         sorted_pts = tuple(sorted(self.points, key=lambda p: p[0]))
         object.__setattr__(self, 'points', sorted_pts)
+        xs = tuple(p[0] for p in sorted_pts)
+        ys = tuple(p[1] for p in sorted_pts)
+        object.__setattr__(self, '_xs', xs)
+        object.__setattr__(self, '_ys', ys)
+        buf = np.array((xs, ys), dtype=np.float64).reshape(2, len(xs))
+        buf.flags.writeable = False
+        object.__setattr__(self, '_buf', buf)
         # Validate squeeze values are physically reasonable
         for focus_m, squeeze in self.points:
             if squeeze < 1.0 or squeeze > self.nominal_squeeze + 0.1:
@@ -286,24 +367,44 @@ class SqueezeBreathingCurve:
                     f"(nominal: {self.nominal_squeeze})"
                 )
 
-    def evaluate(self, focus_m: float) -> float:
+    def evaluate(
+        self, focus_m: float | np.ndarray, hint: list[int] | None = None,
+    ) -> float | np.ndarray:
         """
         Linear interpolation of effective squeeze at given focus distance.
-        Returns nominal_squeeze if no curve data or beyond curve range.
+        Returns nominal_squeeze if no curve data; clamps to the end
+        points beyond curve range.
+
+        focus_m may be a scalar (returns float) or an ndarray of focus
+        distances (returns ndarray of the same shape). hint is an optional
+        caller-owned interval hint for the scalar path (see _lerp_hinted).
         """
-        if not self.points:
-            return self.nominal_squeeze
-        if focus_m <= self.points[0][0]:
-            return self.points[0][1]
-        if focus_m >= self.points[-1][0]:
-            return self.points[-1][1]
-        for i in range(len(self.points) - 1):
-            f0, s0 = self.points[i]
-            f1, s1 = self.points[i + 1]
-            if f0 <= focus_m <= f1:
-                t = (focus_m - f0) / (f1 - f0) if f1 != f0 else 0
-                return s0 + t * (s1 - s0)
-        return self.nominal_squeeze
+        if np.isscalar(focus_m):
+            if not self._xs:
+                return self.nominal_squeeze
+            return _lerp_hinted(self._xs, self._ys, focus_m, hint)
+        if not self._xs:
+            return np.full(np.shape(focus_m), self.nominal_squeeze)
+        if HAVE_NUMBA:
+            d = np.asarray(focus_m, dtype=np.float64)
+            return eval_curve(self._buf[0], self._buf[1], d.ravel()).reshape(d.shape)
+        return np.interp(focus_m, self._buf[0], self._buf[1])
+
+
+# Flyweight table: equal DistortionModel / BreathingCurve values are
+# collapsed onto one shared instance when a LensSpec is built. Values
+# are held weakly, so an entry lives only as long as some spec uses it.
+_FLYWEIGHTS: weakref.WeakValueDictionary[Any, Any] = weakref.WeakValueDictionary()
+
+
+def _intern_value(obj: Any) -> Any:
+    """Return the canonical shared instance equal to frozen obj."""
+    # Key on the compared field values rather than obj itself: a key
+    # that is the value would keep it alive forever.
+    key = (type(obj),) + tuple(
+        getattr(obj, f.name) for f in fields(obj) if f.compare
+    )
+    return _FLYWEIGHTS.setdefault(key, obj)
 
 
 # ════════════════════════════════════════════════════════════
@@ -311,7 +412,7 @@ class SqueezeBreathingCurve:
 # ════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LensSpec:
     """
     Complete lens specification -- v4.0 with mechanical data.
@@ -343,6 +444,11 @@ class LensSpec:
     mechanics: Optional[MechanicalSpec] = None
     squeeze_breathing: Optional[SqueezeBreathingCurve] = None
 
+    # Lazily built by _static_usd_fields
+    _usd_fields: Optional[dict[str, tuple[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
     def __post_init__(self):
         if self.focal_length_mm <= 0:
             raise ValueError(f"Invalid focal length: {self.focal_length_mm}mm")
@@ -350,6 +456,10 @@ class LensSpec:
             raise ValueError(f"Invalid T-stop range: {self.t_stop_min}-{self.t_stop_max}")
         if self.squeeze_ratio < 1.0:
             raise ValueError(f"Invalid squeeze ratio: {self.squeeze_ratio}")
+        for name in ('lens_id', 'manufacturer', 'series'):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        object.__setattr__(self, 'distortion', _intern_value(self.distortion))
+        object.__setattr__(self, 'breathing', _intern_value(self.breathing))
         # Backfill v3.0 physical fields from MechanicalSpec if available
         if self.mechanics and self.weight_kg == 0.0:
             object.__setattr__(self, 'weight_kg', self.mechanics.weight_kg)
@@ -378,8 +488,48 @@ class LensSpec:
             return self.squeeze_breathing.evaluate(focus_distance_m)
         return self.squeeze_ratio
 
+    @property
+    def _static_usd_fields(self) -> dict[str, tuple[str, Any]]:
+        """
+        Frame-invariant part of LensState.to_usd_dict().
+        Built once per spec; callers must copy before mutating.
+        """
+        if self._usd_fields is not None:
+            return self._usd_fields
+        prefix = "cinema:lens"
+        d = self.distortion
+        result = {
+            f"{prefix}:manufacturer":        ("String", self.manufacturer),
+            f"{prefix}:series":              ("String", self.series),
+            f"{prefix}:focalLengthMm":       ("Float",  self.focal_length_mm),
+            f"{prefix}:squeezeRatioNominal": ("Float",  self.squeeze_ratio),
+            f"{prefix}:irisBlades":          ("Int",    self.iris_blades),
+            f"{prefix}:distortion:k1":       ("Float",  d.k1),
+            f"{prefix}:distortion:k2":       ("Float",  d.k2),
+            f"{prefix}:distortion:k3":       ("Float",  d.k3),
+            f"{prefix}:distortion:p1":       ("Float",  d.p1),
+            f"{prefix}:distortion:p2":       ("Float",  d.p2),
+            f"{prefix}:distortion:sqUniformity": ("Float", d.squeeze_uniformity),
+            # Packed copy of the scalars above, as the LOP authors it;
+            # the scalars stay for existing consumers
+            f"{prefix}:distortionCoeffs":    ("FloatArray", d.coeffs),
+        }
+        # v4.0 mechanical attributes
+        if self.has_mechanics:
+            m = self.mechanics
+            result.update({
+                f"{prefix}:weightKg":            ("Float", m.weight_kg),
+                f"{prefix}:lengthMm":            ("Float", m.length_mm),
+                f"{prefix}:frontDiameterMm":     ("Float", m.front_diameter_mm),
+                f"{prefix}:entrancePupilOffsetMm": ("Float", m.entrance_pupil_offset_mm),
+                f"{prefix}:focusRingRotationDeg":  ("Float", m.focus_ring.rotation_deg),
+                f"{prefix}:irisRingRotationDeg":   ("Float", m.iris_ring.rotation_deg),
+            })
+        object.__setattr__(self, '_usd_fields', result)
+        return result
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LensState:
     """Lens state at a single frame -- v4.0 with dynamic squeeze."""
     spec: LensSpec
@@ -406,6 +556,16 @@ class LensState:
         """Dynamic squeeze ratio at current focus distance (Mumps)."""
         return self.spec.effective_squeeze(self.focus_distance_m)
 
+    def effective_squeeze_batch(self, distances_m) -> np.ndarray:
+        """
+        Dynamic squeeze at many focus distances in one vectorized pass,
+        e.g. a whole shot's focus channel for animation export.
+        """
+        d = np.asarray(distances_m, dtype=np.float64)
+        if self.spec.squeeze_breathing:
+            return self.spec.squeeze_breathing.evaluate(d)
+        return np.full_like(d, self.spec.squeeze_ratio)
+
     @property
     def entrance_pupil_offset_cm(self) -> float:
         """Entrance pupil offset in USD centimeters."""
@@ -419,32 +579,10 @@ class LensState:
     def to_usd_dict(self) -> dict[str, tuple[str, Any]]:
         """Flat dictionary for USD attribute authoring -- v4.0 extended."""
         prefix = "cinema:lens"
-        d = self.spec.distortion
-        result = {
-            f"{prefix}:manufacturer":        ("String", self.spec.manufacturer),
-            f"{prefix}:series":              ("String", self.spec.series),
-            f"{prefix}:focalLengthMm":       ("Float",  self.spec.focal_length_mm),
-            f"{prefix}:squeezeRatioNominal": ("Float",  self.spec.squeeze_ratio),
+        result = dict(self.spec._static_usd_fields)
+        result.update({
             f"{prefix}:squeezeRatioEffective": ("Float", self.effective_squeeze),
             f"{prefix}:tStop":               ("Float",  self.t_stop),
             f"{prefix}:focusDistanceM":      ("Float",  self.focus_distance_m),
-            f"{prefix}:irisBlades":          ("Int",    self.spec.iris_blades),
-            f"{prefix}:distortion:k1":       ("Float",  d.k1),
-            f"{prefix}:distortion:k2":       ("Float",  d.k2),
-            f"{prefix}:distortion:k3":       ("Float",  d.k3),
-            f"{prefix}:distortion:p1":       ("Float",  d.p1),
-            f"{prefix}:distortion:p2":       ("Float",  d.p2),
-            f"{prefix}:distortion:sqUniformity": ("Float", d.squeeze_uniformity),
-        }
-        # v4.0 mechanical attributes
-        if self.spec.has_mechanics:
-            m = self.spec.mechanics
-            result.update({
-                f"{prefix}:weightKg":            ("Float", m.weight_kg),
-                f"{prefix}:lengthMm":            ("Float", m.length_mm),
-                f"{prefix}:frontDiameterMm":     ("Float", m.front_diameter_mm),
-                f"{prefix}:entrancePupilOffsetMm": ("Float", m.entrance_pupil_offset_mm),
-                f"{prefix}:focusRingRotationDeg":  ("Float", m.focus_ring.rotation_deg),
-                f"{prefix}:irisRingRotationDeg":   ("Float", m.iris_ring.rotation_deg),
-            })
+        })
         return result
@@ -10,23 +10,41 @@ No Houdini GUI required -- uses pxr module only.
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from operator import attrgetter
+from typing import Any, Callable, Iterable, NamedTuple
 
-from pxr import Gf, Sdf, Usd, UsdGeom, UsdRender
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdRender, UsdUtils, Vt
 
-from .protocols import CameraState, LensState, OpticalResult
+from .protocols import (
+    DISTORTION_COEFFS_LAYOUT, CameraState, LensState, OpticalResult,
+)
 
 
 # ════════════════════════════════════════════════════════════
 # BODY OFFSET CONSTANTS (mm -> cm)
 # ════════════════════════════════════════════════════════════
 
-_BODY_OFFSETS_CM: dict[str, dict[str, float]] = {
-    "ARRI ALEXA 35":  {"y": 5.0, "z": -8.0},
-    "RED KOMODO":     {"y": 3.5, "z": -5.0},
-    "SONY VENICE 2":  {"y": 5.5, "z": -9.0},
+class _BodyOffset(NamedTuple):
+    """Sensor-plane offset from the fluid head pivot, in cm."""
+    x: float
+    y: float
+    z: float
+
+
+_BODY_OFFSETS_CM: dict[str, _BodyOffset] = {
+    sys.intern("ARRI ALEXA 35"):  _BodyOffset(0.0, 5.0, -8.0),
+    sys.intern("RED KOMODO"):     _BodyOffset(0.0, 3.5, -5.0),
+    sys.intern("SONY VENICE 2"):  _BodyOffset(0.0, 5.5, -9.0),
 }
-_DEFAULT_BODY_OFFSET: dict[str, float] = {"y": 4.0, "z": -7.0}
+_DEFAULT_BODY_OFFSET = _BodyOffset(0.0, 4.0, -7.0)
+
+# Same offsets pre-built as Gf.Vec3d for the translate op. Set() copies
+# the value, so the shared instances are never mutated.
+_BODY_OFFSETS_VEC: dict[str, Gf.Vec3d] = {
+    model: Gf.Vec3d(*offset) for model, offset in _BODY_OFFSETS_CM.items()
+}
+_DEFAULT_BODY_OFFSET_VEC = Gf.Vec3d(*_DEFAULT_BODY_OFFSET)
 
 
 # ════════════════════════════════════════════════════════════
@@ -37,26 +55,167 @@ _SDF_TYPE_MAP = {
     "String": Sdf.ValueTypeNames.String,
     "Float":  Sdf.ValueTypeNames.Float,
     "Int":    Sdf.ValueTypeNames.Int,
+    "FloatArray": Sdf.ValueTypeNames.FloatArray,
 }
 
+# customData stamped on the packed distortion attribute, matching the
+# LOP camera_rig.usda template
+_DISTORTION_COEFFS_ATTR = "cinema:lens:distortionCoeffs"
+_DISTORTION_COEFFS_DATA = {"layout": Vt.StringArray(DISTORTION_COEFFS_LAYOUT)}
+
+
+def _author_specs(
+    prim: Usd.Prim,
+    rows: Iterable[tuple[str, Sdf.ValueTypeName, Any]],
+) -> None:
+    """
+    Author custom attributes from (name, sdf_type, value) rows.
+
+    Writes Sdf attribute specs straight into the stage's edit-target
+    layer, skipping the per-attribute composition and value-resolution
+    work of Usd.Prim.CreateAttribute().Set(). The prim must already be
+    defined (schema prims still go through UsdGeom/UsdRender Define).
+    """
+    edit_target = prim.GetStage().GetEditTarget()
+    layer = edit_target.GetLayer()
+    with Sdf.ChangeBlock():
+        prim_spec = Sdf.CreatePrimInLayer(
+            layer, edit_target.MapToSpecPath(prim.GetPath())
+        )
+        attributes = prim_spec.attributes
+        for attr_name, sdf_type, value in rows:
+            attr_spec = attributes.get(attr_name)
+            if attr_spec is None:
+                attr_spec = Sdf.AttributeSpec(
+                    prim_spec, attr_name, sdf_type, declaresCustom=True
+                )
+            if sdf_type.isArray:
+                value = sdf_type.type.pythonClass(value)
+            attr_spec.default = value
+
 
 def _author_attributes(
     prim: Usd.Prim,
     attrs: dict[str, tuple[str, Any]],
 ) -> None:
     """Author custom attributes from a {name: (type_name, value)} dict."""
-    for attr_name, (type_name, value) in attrs.items():
-        sdf_type = _SDF_TYPE_MAP.get(type_name)
-        if sdf_type is None:
-            continue
-        attr = prim.CreateAttribute(attr_name, sdf_type)
-        attr.Set(value)
+    _author_specs(prim, (
+        (attr_name, _SDF_TYPE_MAP[type_name], value)
+        for attr_name, (type_name, value) in attrs.items()
+        if type_name in _SDF_TYPE_MAP
+    ))
+
+
+# ════════════════════════════════════════════════════════════
+# SHARED IN-MEMORY STAGES
+# ════════════════════════════════════════════════════════════
+
+# Stage name -> id in the process-wide UsdUtils.StageCache
+_STAGE_IDS: dict[str, Usd.StageCache.Id] = {}
+
+
+def get_cached_stage(name: str) -> Usd.Stage:
+    """
+    Return the in-memory stage registered under name, creating it on
+    first use. Stages live in UsdUtils.StageCache.Get(), so the Synapse
+    bridge and other tools can share the same stage and layer handles
+    instead of re-composing a fresh stage per build.
+
+    Call release_cached_stage(name) once the rig is disposed of.
+    """
+    cache = UsdUtils.StageCache.Get()
+    stage_id = _STAGE_IDS.get(name)
+    if stage_id is not None:
+        stage = cache.Find(stage_id)
+        if stage:
+            return stage
+    stage = Usd.Stage.CreateInMemory(name)
+    _STAGE_IDS[name] = cache.Insert(stage)
+    return stage
+
+
+def release_cached_stage(name: str) -> bool:
+    """
+    Erase a stage created by get_cached_stage() from the stage cache.
+    The cache holds the only strong reference, so existing handles to
+    the stage expire. Returns False if no such stage was cached.
+    """
+    stage_id = _STAGE_IDS.pop(name, None)
+    if stage_id is None:
+        return False
+    return UsdUtils.StageCache.Get().Erase(stage_id)
 
 
 # ════════════════════════════════════════════════════════════
 # PILLAR B: NODAL PARALLAX USD HIERARCHY
 # ════════════════════════════════════════════════════════════
 
+def _apply_camera_attrs(
+    camera: UsdGeom.Camera,
+    camera_state: CameraState,
+    lens_state: LensState,
+    optical_result: OpticalResult,
+    extra_attrs: dict[str, tuple[str, Any]] | None = None,
+) -> None:
+    """
+    Author the camera schema, optics and camera/lens state attributes
+    shared by the rig Sensor and the flat v3.0 camera. extra_attrs are
+    authored in the same batch as the cinema:* custom attributes.
+    """
+    # Core camera attributes (USD units: mm for aperture/focal, cm for focus)
+    camera.CreateHorizontalApertureAttr().Set(camera_state.active_width_mm)
+    camera.CreateVerticalApertureAttr().Set(camera_state.active_height_mm)
+    camera.CreateFocalLengthAttr().Set(lens_state.spec.focal_length_mm)
+    camera.CreateFocusDistanceAttr().Set(lens_state.focus_distance_m * 100.0)
+    camera.CreateFStopAttr().Set(lens_state.t_stop)
+    camera.CreateClippingRangeAttr().Set(Gf.Vec2f(0.01, 100000.0))
+
+    prim = camera.GetPrim()
+
+    # Optics results
+    attrs = {
+        "cinema:optics:hfovDeg":      ("Float", optical_result.hfov_deg),
+        "cinema:optics:vfovDeg":      ("Float", optical_result.vfov_deg),
+        "cinema:optics:dofNearM":     ("Float", optical_result.dof_near_m),
+        "cinema:optics:dofFarM":      ("Float", optical_result.dof_far_m),
+        "cinema:optics:hyperfocalM":  ("Float", optical_result.hyperfocal_m),
+        "cinema:optics:cocMm":        ("Float", optical_result.coc_mm),
+    }
+
+    # Camera / lens state attributes
+    attrs.update(camera_state.to_usd_dict())
+    attrs.update(lens_state.to_usd_dict())
+    if extra_attrs:
+        attrs.update(extra_attrs)
+    # Custom attributes are raw Sdf specs: one change block per prim
+    _author_attributes(prim, attrs)
+    _stamp_distortion_layout(prim)
+
+
+def _stamp_distortion_layout(prim: Usd.Prim) -> None:
+    """Record DISTORTION_COEFFS_LAYOUT as customData on the packed array."""
+    edit_target = prim.GetStage().GetEditTarget()
+    attr_spec = edit_target.GetLayer().GetAttributeAtPath(
+        edit_target.MapToSpecPath(prim.GetPath()).AppendProperty(
+            _DISTORTION_COEFFS_ATTR
+        )
+    )
+    attr_spec.customData = _DISTORTION_COEFFS_DATA
+
+
+def _require_xform_op(authored: bool, prim_path: str) -> None:
+    """
+    XformCommonAPI setters return False instead of raising when the
+    prim's existing op stack is not XformCommonAPI-compatible (e.g. a
+    prim redefined in a reused stage); surface that as an error.
+    """
+    if not authored:
+        raise ValueError(
+            f"Cannot author xform op on {prim_path}: existing xformOpOrder "
+            f"is not XformCommonAPI-compatible"
+        )
+
+
 def build_usd_camera_rig(
     stage: Usd.Stage,
     rig_path: str,
@@ -77,67 +236,48 @@ def build_usd_camera_rig(
 
     Returns the UsdGeom.Camera at the Sensor prim.
     """
-    # ── Xform: Rig Root ──────────────────────────────────
-    rig_xform = UsdGeom.Xform.Define(stage, rig_path)
-
-    # ── Xform: Fluid Head (pan/tilt pivot) ───────────────
     head_path = f"{rig_path}/FluidHead"
-    head_xform = UsdGeom.Xform.Define(stage, head_path)
-    head_xform.AddRotateXYZOp()  # tilt, pan, roll applied here
-
-    # ── Xform: Camera Body ───────────────────────────────
     body_path = f"{head_path}/Body"
-    body_xform = UsdGeom.Xform.Define(stage, body_path)
-    offsets = _BODY_OFFSETS_CM.get(camera_state.model, _DEFAULT_BODY_OFFSET)
-    body_xform.AddTranslateOp().Set(
-        Gf.Vec3d(0.0, offsets["y"], offsets["z"])
-    )
-
-    # ── Camera: Sensor ───────────────────────────────────
     sensor_path = f"{body_path}/Sensor"
+    pupil_path = f"{sensor_path}/EntrancePupil"
+
+    UsdGeom.Xform.Define(stage, rig_path)             # RIG ROOT
+    head_xform = UsdGeom.Xform.Define(stage, head_path)
+    body_xform = UsdGeom.Xform.Define(stage, body_path)
     camera = UsdGeom.Camera.Define(stage, sensor_path)
+    pupil_xform = UsdGeom.Xform.Define(stage, pupil_path)
 
-    # Core camera attributes (USD units: mm for aperture/focal, cm for focus)
-    camera.CreateHorizontalApertureAttr().Set(camera_state.active_width_mm)
-    camera.CreateVerticalApertureAttr().Set(camera_state.active_height_mm)
-    camera.CreateFocalLengthAttr().Set(lens_state.spec.focal_length_mm)
-    camera.CreateFocusDistanceAttr().Set(lens_state.focus_distance_m * 100.0)
-    camera.CreateFStopAttr().Set(lens_state.t_stop)
-    camera.CreateClippingRangeAttr().Set(Gf.Vec2f(0.01, 100000.0))
+    # Usd-level calls below read composed state, so they run outside
+    # any Sdf.ChangeBlock; only raw spec authoring is batched.
+
+    # ── Xform: Fluid Head (pan/tilt pivot) ───────────────
+    # XformCommonAPI authors the op and xformOpOrder in one pass
+    _require_xform_op(UsdGeom.XformCommonAPI(head_xform).SetRotate(  # tilt, pan, roll applied here
+        Gf.Vec3f(0.0, 0.0, 0.0), UsdGeom.XformCommonAPI.RotationOrderXYZ
+    ), head_path)
+
+    # ── Xform: Camera Body ───────────────────────────────
+    _require_xform_op(UsdGeom.XformCommonAPI(body_xform).SetTranslate(
+        _BODY_OFFSETS_VEC.get(camera_state.model, _DEFAULT_BODY_OFFSET_VEC)
+    ), body_path)
 
-    # Cinema rig custom attributes
-    sensor_prim = camera.GetPrim()
+    # ── Camera: Sensor ───────────────────────────────────
+    # Cinema rig custom attributes share the Sensor's spec batch
     rig_attrs = {
         "cinema:rig:entrancePupilOffsetCm": ("Float", lens_state.entrance_pupil_offset_cm),
         "cinema:rig:combinedWeightKg":      ("Float", lens_state.rig_weight_kg),
         "cinema:rig:effectiveSqueeze":      ("Float", lens_state.effective_squeeze),
         "cinema:rig:fluidHeadModel":        ("String", fluid_head_model),
     }
-    _author_attributes(sensor_prim, rig_attrs)
-
-    # Optics results
-    optics_attrs = {
-        "cinema:optics:hfovDeg":      ("Float", optical_result.hfov_deg),
-        "cinema:optics:vfovDeg":      ("Float", optical_result.vfov_deg),
-        "cinema:optics:dofNearM":     ("Float", optical_result.dof_near_m),
-        "cinema:optics:dofFarM":      ("Float", optical_result.dof_far_m),
-        "cinema:optics:hyperfocalM":  ("Float", optical_result.hyperfocal_m),
-        "cinema:optics:cocMm":        ("Float", optical_result.coc_mm),
-    }
-    _author_attributes(sensor_prim, optics_attrs)
-
-    # Lens state attributes
-    _author_attributes(sensor_prim, camera_state.to_usd_dict())
-    _author_attributes(sensor_prim, lens_state.to_usd_dict())
+    _apply_camera_attrs(
+        camera, camera_state, lens_state, optical_result, extra_attrs=rig_attrs,
+    )
 
     # ── Xform: Entrance Pupil (guide visualization) ──────
-    pupil_path = f"{sensor_path}/EntrancePupil"
-    pupil_xform = UsdGeom.Xform.Define(stage, pupil_path)
-    pupil_xform.AddTranslateOp().Set(
+    _require_xform_op(UsdGeom.XformCommonAPI(pupil_xform).SetTranslate(
         Gf.Vec3d(0.0, 0.0, lens_state.entrance_pupil_offset_cm)
-    )
-    pupil_prim = pupil_xform.GetPrim()
-    UsdGeom.Imageable(pupil_prim).CreatePurposeAttr().Set(
+    ), pupil_path)
+    UsdGeom.Imageable(pupil_xform.GetPrim()).CreatePurposeAttr().Set(
         UsdGeom.Tokens.guide
     )
 
@@ -153,27 +293,7 @@ def build_usd_camera(
 ) -> UsdGeom.Camera:
     """Backwards-compatible v3.0 wrapper. Builds flat camera without rig hierarchy."""
     camera = UsdGeom.Camera.Define(stage, camera_path)
-    camera.CreateHorizontalApertureAttr().Set(camera_state.active_width_mm)
-    camera.CreateVerticalApertureAttr().Set(camera_state.active_height_mm)
-    camera.CreateFocalLengthAttr().Set(lens_state.spec.focal_length_mm)
-    camera.CreateFocusDistanceAttr().Set(lens_state.focus_distance_m * 100.0)
-    camera.CreateFStopAttr().Set(lens_state.t_stop)
-    camera.CreateClippingRangeAttr().Set(Gf.Vec2f(0.01, 100000.0))
-
-    prim = camera.GetPrim()
-    _author_attributes(prim, camera_state.to_usd_dict())
-    _author_attributes(prim, lens_state.to_usd_dict())
-
-    optics_attrs = {
-        "cinema:optics:hfovDeg":      ("Float", optical_result.hfov_deg),
-        "cinema:optics:vfovDeg":      ("Float", optical_result.vfov_deg),
-        "cinema:optics:dofNearM":     ("Float", optical_result.dof_near_m),
-        "cinema:optics:dofFarM":      ("Float", optical_result.dof_far_m),
-        "cinema:optics:hyperfocalM":  ("Float", optical_result.hyperfocal_m),
-        "cinema:optics:cocMm":        ("Float", optical_result.coc_mm),
-    }
-    _author_attributes(prim, optics_attrs)
-
+    _apply_camera_attrs(camera, camera_state, lens_state, optical_result)
     return camera
 
 
@@ -181,6 +301,53 @@ def build_usd_camera(
 # PILLAR E: PIPELINE BRIDGE -- EXR METADATA
 # ════════════════════════════════════════════════════════════
 
+# Full attribute name, value type and value getter for each EXR header
+# field, resolved once at import. Camera rows read a CameraState, lens
+# and mechanics rows read a LensState.
+_ExrSchema = tuple[tuple[str, Sdf.ValueTypeName, Callable[[Any], Any]], ...]
+
+
+def _exr_schema(*rows: tuple[str, str, str]) -> _ExrSchema:
+    return tuple(
+        (f"driver:parameters:OpenEXR:{name}", _SDF_TYPE_MAP[type_name], attrgetter(path))
+        for name, type_name, path in rows
+    )
+
+
+_EXR_CAMERA_SCHEMA = _exr_schema(
+    # Camera identification
+    ("camera:model",           "String", "model"),
+    ("camera:sensorWidthMm",   "Float",  "active_width_mm"),
+    ("camera:sensorHeightMm",  "Float",  "active_height_mm"),
+    ("camera:exposureIndex",   "Int",    "exposure_index"),
+    ("camera:shutterAngleDeg", "Float",  "shutter_angle_deg"),
+    ("camera:colorScience",    "String", "sensor.color_science"),
+)
+
+_EXR_LENS_SCHEMA = _exr_schema(
+    # Lens identification (Cooke /i format)
+    ("lens:manufacturer",   "String", "spec.manufacturer"),
+    ("lens:series",         "String", "spec.series"),
+    ("lens:focalLengthMm",  "Float",  "spec.focal_length_mm"),
+    ("lens:tStop",          "Float",  "t_stop"),
+    ("lens:focusDistanceM", "Float",  "focus_distance_m"),
+    ("lens:irisBlades",     "Int",    "spec.iris_blades"),
+    ("lens:squeezeRatio",   "Float",  "effective_squeeze"),
+
+    # Distortion model (for Nuke STMap/LensDistortion nodes)
+    ("lens:distortion:k1", "Float", "spec.distortion.k1"),
+    ("lens:distortion:k2", "Float", "spec.distortion.k2"),
+    ("lens:distortion:k3", "Float", "spec.distortion.k3"),
+    ("lens:distortion:p1", "Float", "spec.distortion.p1"),
+    ("lens:distortion:p2", "Float", "spec.distortion.p2"),
+)
+
+_EXR_MECHANICS_SCHEMA = _exr_schema(
+    ("lens:entrancePupilOffsetMm", "Float", "spec.mechanics.entrance_pupil_offset_mm"),
+    ("lens:weightKg",              "Float", "spec.mechanics.weight_kg"),
+)
+
+
 def configure_render_product(
     stage: Usd.Stage,
     camera_path: str,
@@ -204,6 +371,13 @@ def configure_render_product(
     cam_name = camera_path.split("/")[-1]
     product_path = f"/Render/Products/{cam_name}"
     product = UsdRender.Product.Define(stage, product_path)
+    prim = product.GetPrim()
+
+    exr_rows = [(name, t, get(camera_state)) for name, t, get in _EXR_CAMERA_SCHEMA]
+    exr_rows += [(name, t, get(lens_state)) for name, t, get in _EXR_LENS_SCHEMA]
+    # Mechanical metadata (if available)
+    if lens_state.spec.has_mechanics:
+        exr_rows += [(name, t, get(lens_state)) for name, t, get in _EXR_MECHANICS_SCHEMA]
 
     # ── Standard render product ──────────────────────────
     product.CreateResolutionAttr().Set(
@@ -213,59 +387,7 @@ def configure_render_product(
     product.GetCameraRel().SetTargets([Sdf.Path(camera_path)])
     product.CreateProductNameAttr().Set(output_path)
 
-    # ── ASWF / Cooke /i EXR Metadata ────────────────────
-    prim = product.GetPrim()
-    d = lens_state.spec.distortion
-
-    exr_metadata: dict[str, tuple[str, Any]] = {
-        # Camera identification
-        "driver:parameters:OpenEXR:camera:model":
-            ("String", camera_state.model),
-        "driver:parameters:OpenEXR:camera:sensorWidthMm":
-            ("Float", camera_state.active_width_mm),
-        "driver:parameters:OpenEXR:camera:sensorHeightMm":
-            ("Float", camera_state.active_height_mm),
-        "driver:parameters:OpenEXR:camera:exposureIndex":
-            ("Int", camera_state.exposure_index),
-        "driver:parameters:OpenEXR:camera:shutterAngleDeg":
-            ("Float", camera_state.shutter_angle_deg),
-        "driver:parameters:OpenEXR:camera:colorScience":
-            ("String", camera_state.sensor.color_science),
-
-        # Lens identification (Cooke /i format)
-        "driver:parameters:OpenEXR:lens:manufacturer":
-            ("String", lens_state.spec.manufacturer),
-        "driver:parameters:OpenEXR:lens:series":
-            ("String", lens_state.spec.series),
-        "driver:parameters:OpenEXR:lens:focalLengthMm":
-            ("Float", lens_state.spec.focal_length_mm),
-        "driver:parameters:OpenEXR:lens:tStop":
-            ("Float", lens_state.t_stop),
-        "driver:parameters:OpenEXR:lens:focusDistanceM":
-            ("Float", lens_state.focus_distance_m),
-        "driver:parameters:OpenEXR:lens:irisBlades":
-            ("Int", lens_state.spec.iris_blades),
-        "driver:parameters:OpenEXR:lens:squeezeRatio":
-            ("Float", lens_state.effective_squeeze),
-
-        # Distortion model (for Nuke STMap/LensDistortion nodes)
-        "driver:parameters:OpenEXR:lens:distortion:k1": ("Float", d.k1),
-        "driver:parameters:OpenEXR:lens:distortion:k2": ("Float", d.k2),
-        "driver:parameters:OpenEXR:lens:distortion:k3": ("Float", d.k3),
-        "driver:parameters:OpenEXR:lens:distortion:p1": ("Float", d.p1),
-        "driver:parameters:OpenEXR:lens:distortion:p2": ("Float", d.p2),
-    }
-
-    # Mechanical metadata (if available)
-    if lens_state.spec.has_mechanics:
-        m = lens_state.spec.mechanics
-        exr_metadata.update({
-            "driver:parameters:OpenEXR:lens:entrancePupilOffsetMm":
-                ("Float", m.entrance_pupil_offset_mm),
-            "driver:parameters:OpenEXR:lens:weightKg":
-                ("Float", m.weight_kg),
-        })
-
-    _author_attributes(prim, exr_metadata)
+    # ── ASWF / Cooke /i EXR Metadata (one Sdf change block) ──
+    _author_specs(prim, exr_rows)
 
     return product